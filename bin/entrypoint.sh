@@ -6,6 +6,12 @@
   sleep 1
 done
 
+# Metrics files are named by PIDs, so the directory must be per container and cleaned up on start
+if [ -n "${PROMETHEUS_MULTIPROC_DIR:-}" ]; then
+  mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+  find "$PROMETHEUS_MULTIPROC_DIR" -mindepth 1 -delete
+fi
+
 python manage.py migrate
 
 exec "$@"
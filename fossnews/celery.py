@@ -1,6 +1,8 @@
 import os
+from time import perf_counter
 
 from celery import Celery
+from celery.signals import task_postrun, task_prerun, worker_init, worker_process_init, worker_process_shutdown
 
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fossnews.settings')
@@ -8,3 +10,47 @@
 app = Celery('fossnews')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def start_metrics_server(**kwargs):
+    """Serve metrics of the worker processes on ``CELERY_METRICS_PORT`` (if set) from the main worker process."""
+    if port := os.environ.get('CELERY_METRICS_PORT'):
+        from prometheus_client import start_http_server
+
+        from .gatherer.metrics import metrics_registry
+
+        start_http_server(int(port), registry=metrics_registry())
+
+
+@worker_process_init.connect
+def preload_nlp_models(**kwargs):
+    from django.conf import settings
+
+    from .gatherer.nlp import nlp_models
+
+    nlp_models.preload(settings.SPACY_PRELOAD)
+
+
+task_started_at: dict[str, float] = {}
+
+
+@task_prerun.connect
+def start_task_timer(task_id: str, **kwargs):
+    task_started_at[task_id] = perf_counter()
+
+
+@task_postrun.connect
+def observe_task_time(task_id: str, task, state: str | None = None, **kwargs):
+    from .gatherer.metrics import TASK_TIME
+
+    if (started_at := task_started_at.pop(task_id, None)) is not None:
+        TASK_TIME.labels(task.name, state or 'UNKNOWN').observe(perf_counter() - started_at)
+
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(**kwargs):
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(os.getpid())
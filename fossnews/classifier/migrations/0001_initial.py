@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('gatherer', '0004_source_watermark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NewsCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64)),
+                ('description', models.TextField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'category',
+                'verbose_name_plural': 'categories',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='NewsTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64)),
+                ('description', models.TextField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'tag',
+                'verbose_name_plural': 'tags',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ClassificationAttempt',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('classified_at', models.DateTimeField()),
+                ('status', models.CharField(blank=True, choices=[('in_digest', 'In Digest'), ('outdated', 'Outdated'), ('duplicate', 'Duplicate'), ('ignored', 'Ignored'), ('filtered', 'Filtered'), ('skipped', 'Skipped')], max_length=16, null=True)),
+                ('front_page', models.BooleanField(blank=True, null=True)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='classifier.newscategory')),
+                ('classificator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('news', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='gatherer.news')),
+            ],
+            options={
+                'ordering': ['-classified_at', 'news__title'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Classification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(blank=True, choices=[('in_digest', 'In Digest'), ('outdated', 'Outdated'), ('duplicate', 'Duplicate'), ('ignored', 'Ignored'), ('filtered', 'Filtered'), ('skipped', 'Skipped')], max_length=16, null=True)),
+                ('front_page', models.BooleanField(blank=True, null=True)),
+                ('content_type', models.CharField(choices=[('article', 'article'), ('news', 'news'), ('release', 'release'), ('video', 'video'), ('other', 'other'), ('unknown', 'unknown')], default='article', max_length=8)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='classifier.newscategory')),
+                ('digest_issue', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to='gatherer.digestissue')),
+                ('news', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='gatherer.news')),
+                ('tags', models.ManyToManyField(to='classifier.newstag')),
+            ],
+            options={
+                'ordering': ['digest_issue__number', 'status', 'news__title'],
+            },
+        ),
+    ]
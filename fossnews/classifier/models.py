@@ -51,7 +51,7 @@ class Meta:
 
 class Classification(models.Model):
     news = models.OneToOneField('gatherer.News', on_delete=models.CASCADE)
-    digest_issue = models.ForeignKey('core.DigestIssue', null=True, on_delete=models.SET_NULL)
+    digest_issue = models.ForeignKey('gatherer.DigestIssue', null=True, on_delete=models.SET_NULL)
     status = models.CharField(max_length=16, choices=NewsStatus.choices, blank=True, null=True)
     front_page = models.BooleanField(blank=True, null=True)
     content_type = models.CharField(max_length=8, choices=ContentType.choices, default=ContentType.ARTICLE)
@@ -0,0 +1,33 @@
+from dynamic_preferences.preferences import Section
+from dynamic_preferences.registries import global_preferences_registry as registry
+from dynamic_preferences.types import IntegerPreference
+
+
+classifier = Section('classifier', verbose_name='Classifier')
+
+
+@registry.register
+class ChunkSize(IntegerPreference):
+    section = classifier
+    name = 'chunk_size'
+    verbose_name = 'Chunk size'
+    help_text = 'The number of news loaded from and saved to DB at once.'
+    default = 1000
+
+
+@registry.register
+class BatchSize(IntegerPreference):
+    section = classifier
+    name = 'batch_size'
+    verbose_name = 'Batch size'
+    help_text = 'The number of news processed by spaCy at once.'
+    default = 64
+
+
+@registry.register
+class Processes(IntegerPreference):
+    section = classifier
+    name = 'n_process'
+    verbose_name = 'Processes'
+    help_text = 'The number of spaCy processes (only for non-transformer models and non-daemon Celery pools).'
+    default = 1
@@ -0,0 +1,102 @@
+import logging
+import re
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from celery import shared_task
+from django.db import transaction
+from dynamic_preferences.registries import global_preferences_registry
+
+from ..gatherer.models import ContentType, Language, News
+from ..gatherer.nlp import nlp_models
+from .models import Classification, NewsCategory, NewsTag
+
+
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
+
+log = logging.getLogger('fossnews.classifier')
+preferences = global_preferences_registry.manager()
+
+# Named entity labels used as news tags
+TAG_LABELS = frozenset({'ORG', 'PRODUCT', 'WORK_OF_ART'})
+RE_VERSION = re.compile(r'^v?\d+(\.\d+)+$')
+
+
+def classify_doc(doc: 'Doc', news: News, categories: dict[str, NewsCategory]) -> tuple[Classification, set[str]]:
+    """
+    Classify processed news.
+
+    :param doc: processed news text.
+    :param news: news.
+    :param categories: news categories by lowercase name.
+    :return: News classification and tags names.
+    """
+    lemmas = {t.lemma_.lower() for t in doc}
+
+    content_type = news.content_type
+    if content_type == ContentType.UNKNOWN:
+        is_release = 'release' in lemmas and any(RE_VERSION.match(t.text) for t in doc)
+        content_type = ContentType.RELEASE if is_release else ContentType.NEWS
+
+    category = next((c for name, c in categories.items() if name in lemmas), None)
+    tags = {e.text.strip()[:64] for e in doc.ents if e.label_ in TAG_LABELS}
+
+    return Classification(news=news, content_type=content_type, category=category), tags
+
+
+def save_classifications(classifications: list[tuple[Classification, set[str]]]):
+    """
+    Save classifications and their tags: one query for classifications, a few for tags.
+
+    :param classifications: classifications and their tags names.
+    """
+    names = set().union(*(tags for _, tags in classifications))
+
+    with transaction.atomic():
+        tags = dict(NewsTag.objects.filter(name__in=names).values_list('name', 'pk'))
+        new_tags = NewsTag.objects.bulk_create([NewsTag(name=name) for name in names - tags.keys()])
+        tags.update((t.name, t.pk) for t in new_tags)
+
+        Classification.objects.bulk_create([c for c, _ in classifications])
+        Tags = Classification.tags.through
+        Tags.objects.bulk_create([
+            Tags(classification_id=c.pk, newstag_id=tags[name])
+            for c, names in classifications for name in names
+        ])
+
+
+@shared_task(name='classify')
+def classify(language: str | None = None) -> dict:
+    """
+    Classify news that have not been classified yet.
+
+    News are streamed from DB in chunks and processed with `nlp.pipe` in batches.
+
+    :param language: news language (all languages if not set).
+    :return: The number of classified news and throughput (docs/s) by language.
+    """
+    chunk_size = preferences['classifier.chunk_size']
+    batch_size = preferences['classifier.batch_size']
+    n_process = preferences['classifier.n_process']
+    categories = {c.name.lower(): c for c in NewsCategory.objects.all()}
+    stats = {}
+
+    for language in [Language(language)] if language else Language:
+        news = News.objects.filter(language=language, classification__isnull=True).order_by('pk')
+        count = 0
+        last_pk = 0
+        start = perf_counter()
+
+        while chunk := list(news.filter(pk__gt=last_pk)[:chunk_size]):
+            last_pk = chunk[-1].pk
+            docs = nlp_models.pipe(chunk, language, batch_size=batch_size, n_process=n_process)
+            save_classifications([classify_doc(doc, n, categories) for doc, n in docs])
+            count += len(chunk)
+
+        elapsed = perf_counter() - start
+        stats[language.value] = dict(count=count, docs_per_second=count / elapsed if count else 0.)
+        log.info('Classified %d news in %s (%.1f docs/s)', count, language.label, stats[language.value]['docs_per_second'])
+
+    return stats
@@ -26,36 +26,52 @@ def toggle(self, request, queryset):
 
 @admin.register(GatheringResult)
 class GatheringResultAdmin(admin.ModelAdmin):
-    list_display = ('started_at', 'finished_at', 'source', 'total_count', 'saved_count', 'filtered_count', 'errors_count')
+    list_display = (
+        'started_at', 'finished_at', 'source',
+        'total_count', 'saved_count', 'filtered_count', 'errors_count', 'not_modified',
+        'http_status', 'fetch_time', 'parse_time', 'enrich_time', 'insert_time', 'response_bytes',
+    )
     list_display_links = ('started_at', 'finished_at', 'source')
     fields = (
         ('started_at', 'finished_at'),
         'source',
         ('total_count', 'saved_count', 'filtered_count', 'errors_count'),
+        'not_modified',
+        ('http_status', 'response_bytes', 'retry_count'),
+        ('fetch_time', 'parse_time', 'enrich_time', 'dedup_time', 'insert_time'),
         'errors',
         'news',
     )
     readonly_fields = (
         'source', 'started_at', 'finished_at',
-        'total_count', 'saved_count', 'filtered_count', 'errors_count',
+        'total_count', 'saved_count', 'filtered_count', 'errors_count', 'not_modified',
+        'http_status', 'response_bytes', 'retry_count',
+        'fetch_time', 'parse_time', 'enrich_time', 'dedup_time', 'insert_time',
         'errors', 'news',
     )
+    list_select_related = ('source',)
     date_hierarchy = 'finished_at'
+    news_limit = 100  # The number of news to display
 
     @admin.display(description='News')
     def news(self, model) -> str:
-        return ',\n'.join(f'{n.title} ({n.url})' for n in model.news_set.all())
+        news = list(model.news_set.only('title', 'url')[:self.news_limit + 1])
+        s = ',\n'.join(f'{n.title} ({n.url})' for n in news[:self.news_limit])
+        if len(news) > self.news_limit:
+            s += f',\n... and {model.news_set.count() - self.news_limit} more'
+        return s
 
 
 @admin.register(News)
 class NewsAdmin(admin.ModelAdmin):
     list_display = ('title', 'author', 'url', 'published_at', 'gathered_at', 'source')
     list_display_links = ('title',)
+    list_select_related = ('gathering__source',)
     date_hierarchy = 'gathered_at'
 
     @admin.display(description='Source')
-    def source(self, model) -> Source:
-        return model.gathering.source
+    def source(self, model) -> Source | None:
+        return model.gathering.source if model.gathering else None
 
 
 @admin.register(DigestIssue)
@@ -70,4 +86,5 @@ class DigestIssueAdmin(admin.ModelAdmin):
 class DigestIssueLinkAdmin(admin.ModelAdmin):
     list_display = ('issue', 'type', 'url')
     list_display_links = ('issue',)
+    list_select_related = ('issue',)
     list_editable = ('type', 'url')
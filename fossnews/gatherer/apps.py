@@ -5,3 +5,6 @@
 class GathererConfig(AppConfig):
     name = 'fossnews.gatherer'
     verbose_name = _('Gatherer')
+
+    def ready(self):
+        from . import cache  # noqa: F401 (connect signal receivers)
@@ -0,0 +1,140 @@
+"""
+Async-native read-only API.
+
+Rows are fetched with the async ORM as dicts and rendered to JSON directly (no model instances, no serializers),
+so requests don't occupy threadpool slots except for the session authentication check.
+"""
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import BinaryField, Model, Q, QuerySet
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from .models import GatheringResult, News, Source
+
+
+__all__ = (
+    'AsyncGatheringResultView',
+    'AsyncNewsView',
+    'AsyncSourceView',
+)
+
+
+def model_fields(model: type[Model]) -> tuple[str, ...]:
+    """Get names of model fields that can be rendered to JSON (foreign keys are rendered as IDs)."""
+    return tuple(f.name for f in model._meta.concrete_fields if not isinstance(f, BinaryField))
+
+
+class AsyncModelView(View):
+    """
+    Async list and retrieve endpoint of a model with keyset pagination.
+
+    List response is ``{"next": "<URL or null>", "results": [...]}``; page size is set by `page_size` parameter.
+    """
+    queryset: QuerySet
+    ordering: tuple[str, str]  # Key field and primary key, e.g. ('-gathered_at', '-id')
+    admin_only = True
+    max_page_size = 1000
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return model_fields(self.queryset.model)
+
+    def get_queryset(self) -> QuerySet:
+        return self.queryset.all()
+
+    def get_list_queryset(self) -> QuerySet:
+        return self.get_queryset()
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs):
+        if self.admin_only and not await sync_to_async(lambda: request.user.is_staff)():
+            return JsonResponse({'detail': 'You do not have permission to perform this action.'}, status=403)
+
+        return await super().dispatch(request, *args, **kwargs)
+
+    async def get(self, request: HttpRequest, pk: int | None = None) -> JsonResponse:
+        if pk is not None:
+            return await self.retrieve(pk)
+
+        return await self.list(request)
+
+    async def retrieve(self, pk: int) -> JsonResponse:
+        try:
+            return JsonResponse(await self.get_queryset().values(*self.fields).aget(pk=pk))
+        except self.queryset.model.DoesNotExist:
+            return JsonResponse({'detail': 'Not found.'}, status=404)
+
+    async def list(self, request: HttpRequest) -> JsonResponse:
+        try:
+            page_size = min(int(request.GET.get('page_size', settings.REST_FRAMEWORK['PAGE_SIZE'])), self.max_page_size)
+            if page_size < 1:
+                raise ValueError(f'Invalid page size: {page_size}')
+            rows = self.get_list_queryset().order_by(*self.ordering)
+            if cursor := request.GET.get('cursor'):
+                rows = rows.filter(self.after(self.decode_cursor(cursor)))
+        except ValueError as e:
+            return JsonResponse({'detail': str(e)}, status=400)
+
+        key, _ = (f.lstrip('-') for f in self.ordering)
+        results = [row async for row in rows.values(*self.fields)[:page_size + 1]]
+
+        next_url = None
+        if len(results) > page_size:
+            results = results[:page_size]
+            params = request.GET.copy()
+            params['cursor'] = self.encode_cursor((results[-1][key], results[-1]['id']))
+            next_url = request.build_absolute_uri(f'{request.path}?{params.urlencode()}')
+
+        return JsonResponse({'next': next_url, 'results': results})
+
+    def after(self, cursor: tuple) -> Q:
+        """Get filter of rows after the cursor in the view ordering."""
+        (key, pk), (value, last_pk) = self.ordering, cursor
+        lookup = 'lt' if key.startswith('-') else 'gt'
+        key, pk = key.lstrip('-'), pk.lstrip('-')
+        return Q(**{f'{key}__{lookup}': value}) | Q(**{key: value, f'{pk}__{lookup}': last_pk})
+
+    @staticmethod
+    def encode_cursor(cursor: tuple) -> str:
+        value, pk = cursor
+        value = value.isoformat() if hasattr(value, 'isoformat') else value
+        return urlsafe_b64encode(json.dumps([value, pk]).encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> tuple:
+        """
+        Decode page cursor.
+
+        :param cursor: encoded cursor.
+        :return: Key field value and primary key of the last row of the previous page.
+        :raise ValueError: if cursor is invalid.
+        """
+        try:
+            value, pk = json.loads(urlsafe_b64decode(cursor.encode()))
+            field = self.queryset.model._meta.get_field(self.ordering[0].lstrip('-'))
+            return field.to_python(value), int(pk)
+        except (BinasciiError, UnicodeDecodeError, TypeError, ValueError, ValidationError) as e:
+            raise ValueError(f'Invalid cursor: {cursor}') from e
+
+
+class AsyncSourceView(AsyncModelView):
+    queryset = Source.objects.all()
+    ordering = ('title', 'id')
+
+
+class AsyncGatheringResultView(AsyncModelView):
+    queryset = GatheringResult.objects.all()
+    ordering = ('-finished_at', '-id')
+    admin_only = False
+
+    def get_list_queryset(self) -> QuerySet:
+        return super().get_list_queryset().filter(finished_at__isnull=False)  # Cursor can't point to unfinished gathering
+
+
+class AsyncNewsView(AsyncModelView):
+    queryset = News.objects.all()
+    ordering = ('-gathered_at', '-id')
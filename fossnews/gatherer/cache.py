@@ -0,0 +1,99 @@
+"""
+Gatherer API responses cache.
+
+Cached responses are invalidated all at once by bumping the data version (it's a part of cache keys and ETags)
+when gathered data is changed: stale entries are never read again and expire eventually.
+"""
+import hashlib
+from collections.abc import Callable
+from time import time
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .models import GatheringResult, News
+
+
+__all__ = (
+    'CachedResponseMixin',
+    'abump_version',
+    'bump_version',
+)
+
+
+VERSION_KEY = 'gatherer:version'
+RESPONSE_TIMEOUT = 24 * 60 * 60  # Seconds
+
+
+def initial_version() -> int:
+    # Not 1: if the version key is evicted, stale responses of the previous versions must not be reused
+    return int(time() * 1000)
+
+
+def get_version() -> int:
+    return cache.get_or_set(VERSION_KEY, initial_version, timeout=None)
+
+
+def bump_version():
+    """Invalidate cached responses."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:  # No version yet
+        cache.add(VERSION_KEY, initial_version(), timeout=None)
+
+
+async def abump_version():
+    """Invalidate cached responses."""
+    try:
+        await cache.aincr(VERSION_KEY)
+    except ValueError:  # No version yet
+        await cache.aadd(VERSION_KEY, initial_version(), timeout=None)
+
+
+@receiver(post_save, sender=News)
+@receiver(post_delete, sender=News)
+@receiver(post_save, sender=GatheringResult)
+@receiver(post_delete, sender=GatheringResult)
+def invalidate_responses(sender, **kwargs):
+    """Invalidate cached responses when news or gathering results are changed (e.g. in the admin)."""
+    bump_version()
+
+
+class CachedResponseMixin:
+    """
+    Cache list and retrieve responses data of a view set by request URL.
+
+    Responses have ETag, so clients can revalidate them with `If-None-Match` and get ``304 Not Modified``
+    without the response data being loaded even from the cache.
+    The cache is invalidated on changes of news and gathering results (see :func:`invalidate_responses`)
+    and on news saved by the gathering pipeline (bulk inserts don't send signals).
+    """
+
+    def cached_response(self, request: Request, get_response: Callable[[], Response]) -> Response:
+        version = get_version()
+        url = hashlib.md5(f'{request.accepted_renderer.format}:{request.build_absolute_uri()}'.encode()).hexdigest()
+        key = f'gatherer:response:{version}:{url}'
+        etag = f'"{version}-{url}"'
+
+        if etag in request.headers.get('If-None-Match', ''):
+            response = Response(status=304)
+        elif (data := cache.get(key)) is not None:
+            response = Response(data)
+        else:
+            response = get_response()
+            if response.status_code != 200:
+                return response
+            cache.set(key, response.data, timeout=RESPONSE_TIMEOUT)
+
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        return self.cached_response(request, lambda: super(CachedResponseMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return self.cached_response(request, lambda: super(CachedResponseMixin, self).retrieve(request, *args, **kwargs))
@@ -1,6 +1,8 @@
+from calendar import timegm
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from time import mktime, struct_time
+from time import struct_time
 
 
 class DateTimeFormats(Enum):
@@ -12,7 +14,7 @@ def to_datetime(dt: datetime | struct_time | str, fmt: str = DateTimeFormats.RFC
     if isinstance(dt, datetime):
         return dt
     elif isinstance(dt, struct_time):
-        return datetime.fromtimestamp(mktime(dt), timezone.utc)
+        return datetime.fromtimestamp(timegm(dt), timezone.utc)  # Time is in UTC (as parsed by `feedparser`)
     elif isinstance(dt, str):
         return datetime.strptime(dt, fmt)
     else:
@@ -28,3 +30,25 @@ def format_datetime(dt: datetime | struct_time | str, fmt: str = DateTimeFormats
     :return: date and time in ISO 8601 format.
     """
     return to_datetime(dt, fmt=fmt).strftime(DateTimeFormats.ISO8601.value)
+
+
+def parse_feed_datetime(value: str | None) -> datetime | None:
+    """
+    Parse feed date and time: RFC 822 (RSS) or ISO 8601 (Atom).
+
+    :param value: date and time string.
+    :return: Date and time in UTC (UTC is assumed if time zone is not set), or `None` if value can't be parsed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
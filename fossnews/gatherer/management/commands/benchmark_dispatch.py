@@ -0,0 +1,53 @@
+import random
+import re
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from ...parsers import UrlPatternIndex
+
+
+class Command(BaseCommand):
+    help = 'Benchmark news parsers dispatch: linear search vs. URL pattern index.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--patterns', type=int, default=1000, help='The number of registered URL patterns.')
+        parser.add_argument('--urls', type=int, default=100_000, help='The number of URLs to dispatch.')
+        parser.add_argument('--hosts', type=int, default=200, help='The number of distinct hosts.')
+        parser.add_argument('--generic', type=float, default=.05, help='Share of patterns without a literal host.')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed.')
+
+    def handle(self, *args, **options):
+        rnd = random.Random(options['seed'])
+        hosts = [f'www.host{i}.com' for i in range(options['hosts'])]
+
+        patterns = []
+        for i in range(options['patterns']):
+            if rnd.random() < options['generic']:
+                patterns.append(re.compile(rf'^https?://[^/]+/generic{i}/'))
+            else:
+                patterns.append(re.compile(rf'^https://{re.escape(rnd.choice(hosts))}/section{i}/'))
+
+        urls = [
+            f'https://{rnd.choice(hosts)}/section{rnd.randrange(options["patterns"] * 2)}/{i}'
+            for i in range(options['urls'])
+        ]
+
+        start = perf_counter()
+        linear = [next((i for i, p in enumerate(patterns) if p.match(url)), None) for url in urls]
+        linear_time = perf_counter() - start
+
+        index = UrlPatternIndex()
+        for i, p in enumerate(patterns):
+            index.add(p, i)
+        start = perf_counter()
+        indexed = [index.find(url) for url in urls]
+        index_time = perf_counter() - start
+
+        if linear != indexed:
+            self.stderr.write(self.style.ERROR('Dispatch results differ!'))
+
+        self.stdout.write(f'{len(patterns)} patterns x {len(urls)} URLs ({len(hosts)} hosts):')
+        for name, t in [('linear', linear_time), ('index', index_time)]:
+            self.stdout.write(f'  {name:<8}{t:10.3f} s {t / len(urls) * 1e6:10.2f} us/URL')
+        self.stdout.write(f'  speedup {linear_time / index_time:10.1f}x')
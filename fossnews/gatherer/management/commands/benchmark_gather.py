@@ -0,0 +1,209 @@
+import asyncio
+import math
+import random
+import resource
+import socket
+import statistics
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from time import perf_counter
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from dynamic_preferences.registries import global_preferences_registry
+
+from ...models import Source
+from ...tasks import agather
+
+
+class FeedServer:
+    """Local HTTP server of synthetic RSS and Atom feeds (run in a separate thread with its own event loop)."""
+
+    def __init__(self, entries: int, payload: int, latency: float, error_rate: float, seed: int):
+        """
+        :param entries: the number of entries per feed.
+        :param payload: entry summary size (in bytes).
+        :param latency: response delay (in seconds).
+        :param error_rate: share of ``500 Internal Server Error`` responses.
+        :param seed: random seed.
+        """
+        self.entries = entries
+        self.payload = payload
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self.rnd = random.Random(seed)
+        self.now = datetime.now(timezone.utc).replace(microsecond=0)
+        self.words = [''.join(self.rnd.choices('abcdefghijklmnopqrstuvwxyz', k=self.rnd.randint(2, 10)))
+                      for _ in range(5000)]
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.runner: web.AppRunner | None = None
+        self.url = ''
+
+    def text(self, rnd: random.Random, size: int) -> str:
+        words, length = [], 0
+        while length < size:
+            words.append(rnd.choice(self.words))
+            length += len(words[-1]) + 1
+        return ' '.join(words)
+
+    @lru_cache(maxsize=None)
+    def feed(self, n: int) -> bytes:
+        rnd = random.Random(self.seed * 1_000_003 + n)  # Feeds don't change between requests
+        base = f'{self.url}/news/{n}'
+        entries = [
+            (f'{base}/{i}', self.text(rnd, 60), self.text(rnd, self.payload), self.now - timedelta(minutes=i))
+            for i in range(self.entries)
+        ]
+
+        if n % 2:
+            items = ''.join(
+                f'<entry><id>{url}</id><link href="{url}"/><title>{title}</title>'
+                f'<summary>{escape(summary)}</summary><published>{at.isoformat()}</published>'
+                f'<updated>{at.isoformat()}</updated></entry>'
+                for url, title, summary, at in entries
+            )
+            return (f'<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+                    f'<title>Feed {n}</title><id>{base}</id><updated>{self.now.isoformat()}</updated>'
+                    f'{items}</feed>').encode()
+
+        items = ''.join(
+            f'<item><guid>{url}</guid><link>{url}</link><title>{title}</title>'
+            f'<description>{escape(summary)}</description><pubDate>{format_datetime(at)}</pubDate></item>'
+            for url, title, summary, at in entries
+        )
+        return (f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+                f'<title>Feed {n}</title><link>{base}</link><language>en</language>{items}</channel></rss>').encode()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.latency)
+        if self.rnd.random() < self.error_rate:
+            return web.Response(status=500)
+
+        n = int(request.match_info['n'])
+        return web.Response(body=self.feed(n), content_type='application/atom+xml' if n % 2 else 'application/rss+xml')
+
+    async def start_server(self, sock: socket.socket):
+        app = web.Application()
+        app.router.add_get('/feeds/{n:\\d+}', self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.SockSite(self.runner, sock).start()
+
+    def start(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        self.url = f'http://127.0.0.1:{sock.getsockname()[1]}'
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.start_server(sock), self.loop).result()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+def percentiles(values: list[float]) -> str:
+    if len(values) < 2:
+        return '-'
+
+    q = statistics.quantiles(values, n=100, method='inclusive')
+    return f'p50 {q[49]:8.3f}  p90 {q[89]:8.3f}  p99 {q[98]:8.3f}  max {max(values):8.3f}'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark news gathering from a local fake feed server using a test DB.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sources', type=int, default=100, help='The number of sources.')
+        parser.add_argument('--entries', type=int, default=50, help='The number of entries per feed.')
+        parser.add_argument('--payload', type=int, default=1000, help='Entry summary size (in bytes).')
+        parser.add_argument('--latency', type=float, default=.05, help='Feed server response delay (in seconds).')
+        parser.add_argument('--error-rate', type=float, default=0., help='Share of feed server error responses.')
+        parser.add_argument('--executor', choices=('loop', 'thread', 'process'), help='Parser executor mode.')
+        parser.add_argument('--workers', type=int, help='The number of sources gathered concurrently.')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed.')
+
+    def handle(self, *args, **options):
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        server = FeedServer(options['entries'], options['payload'], options['latency'], options['error_rate'],
+                            options['seed'])
+        server.start()
+
+        try:
+            with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+                self.benchmark(server, options)
+        finally:
+            server.stop()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def benchmark(self, server: FeedServer, options: dict):
+        preferences = global_preferences_registry.manager()
+        preferences['gatherer.connection_retries'] = 1  # Single attempt (0 means infinite retries): don't measure retries
+        preferences['gatherer.host_request_delay'] = 0.  # All sources are on the same host
+        preferences['gatherer.host_connection_limit'] = preferences['gatherer.connection_limit']
+        if options['executor']:
+            preferences['gatherer.parser_executor'] = options['executor']
+        if options['workers']:
+            preferences['gatherer.source_workers'] = options['workers']
+
+        Source.objects.bulk_create([
+            Source(title=f'Benchmark source {i}', url=f'{server.url}/feeds/{i}') for i in range(options['sources'])
+        ])
+
+        # Thread-sensitive DB calls of `agather` run in this thread, so all queries are captured
+        with CaptureQueriesContext(connection) as queries:
+            start = perf_counter()
+            results = async_to_sync(agather)()
+            elapsed = perf_counter() - start
+
+        sources = len(results)
+        entries = sum(r['total_count'] for r in results)
+        self.stdout.write(
+            f'{sources} sources x {options["entries"]} entries ({options["payload"]} B, '
+            f'{options["latency"] * 1000:.0f} ms latency, {options["error_rate"]:.0%} errors):'
+        )
+        self.stdout.write(f'  elapsed       {elapsed:10.3f} s')
+        self.stdout.write(f'  sources/s     {sources / elapsed:10.1f}')
+        self.stdout.write(f'  entries/s     {entries / elapsed:10.1f}')
+        self.stdout.write(f'  saved         {sum(r["saved_count"] for r in results):10d}')
+        self.stdout.write(f'  errors        {sum(r["errors_count"] for r in results):10d}')
+        self.stdout.write(f'  queries       {len(queries):10d} ({len(queries) / max(sources, 1):.1f} per source)')
+
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+        self.stdout.write(f'  peak RSS      {usage:10.1f} MiB (parser processes: {children:.1f} MiB)')
+
+        self.stdout.write('Latency (s):')
+        durations = [(r['finished_at'] - r['started_at']).total_seconds() for r in results if r['finished_at']]
+        self.stdout.write(f'  source        {percentiles(durations)}')
+        for stage in ('fetch', 'parse', 'enrich', 'dedup', 'insert'):
+            self.stdout.write(f'  {stage:<14}{percentiles([r[f"{stage}_time"] for r in results])}')
+
+        self.check_errors(results, options['error_rate'])
+
+    @staticmethod
+    def check_errors(results: list[dict], error_rate: float):
+        """
+        Check that only feed server error responses failed (synthetic feeds are valid).
+
+        :param results: gathering results.
+        :param error_rate: share of feed server error responses.
+        :raise CommandError: if entries failed to be gathered or the share of failed sources is unexpected.
+        """
+        if errors := sum(r['errors_count'] for r in results):
+            raise CommandError(f'{errors} entries failed to be gathered: the benchmark is invalid')
+
+        # Sources fail independently, so the number of failed ones is binomial: allow 4 standard deviations
+        sources, failed = len(results), sum(r['http_status'] == 500 for r in results)
+        deviation = 4 * math.sqrt(sources * error_rate * (1 - error_rate))
+        if abs(failed - sources * error_rate) > deviation:
+            raise CommandError(f'{failed} of {sources} sources failed while {error_rate:.0%} were expected to fail: '
+                               f'the benchmark is invalid')
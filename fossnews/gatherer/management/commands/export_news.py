@@ -0,0 +1,44 @@
+import sys
+from datetime import date
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import DigestIssue
+from ...streaming import EXPORT_FORMATS, export_news, issue_news, period_news
+
+
+class Command(BaseCommand):
+    help = 'Export news gathered during a period or for a digest issue as CSV or NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', type=date.fromisoformat, help='Period start date (inclusive), YYYY-MM-DD.')
+        parser.add_argument('--until', type=date.fromisoformat, help='Period end date (exclusive), YYYY-MM-DD.')
+        parser.add_argument('--issue', type=int, help='Digest issue number (instead of period).')
+        parser.add_argument('--format', choices=EXPORT_FORMATS, default='csv', help='Output format.')
+        parser.add_argument('--output', help='Output file (standard output by default).')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='The number of rows fetched at once.')
+
+    def handle(self, *args, **options):
+        if options['issue'] is not None:
+            try:
+                news = issue_news(DigestIssue.objects.get(number=options['issue']))
+            except DigestIssue.DoesNotExist:
+                raise CommandError(f'Digest issue #{options["issue"]} does not exist')
+        else:
+            news = period_news(options['since'], options['until'])
+
+        output = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        count = -1  # Header
+        start = perf_counter()
+
+        try:
+            for line in export_news(news, options['format'], chunk_size=options['chunk_size']):
+                output.write(line)
+                count += 1
+        finally:
+            if options['output']:
+                output.close()
+
+        elapsed = perf_counter() - start
+        self.stderr.write(f'Exported {count} news in {elapsed:.1f} s ({count / elapsed:.0f} rows/s)')
@@ -0,0 +1,78 @@
+"""
+`Prometheus`_ metrics of news gathering and Celery tasks.
+
+Metrics are collected from all processes of the web server or Celery worker if ``PROMETHEUS_MULTIPROC_DIR``
+environment variable is set: see `multiprocess mode`_. The directory must be separate for each container
+(files are named by PIDs), so web and Celery worker metrics are scraped separately.
+
+.. _Prometheus: https://prometheus.io/docs/concepts/metric_types/
+.. _multiprocess mode: https://prometheus.github.io/client_python/multiprocess/
+"""
+import os
+from urllib.parse import urlsplit
+
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+
+from .models import GatheringResult
+
+
+__all__ = (
+    'ENTRIES',
+    'FETCH_TIME',
+    'INFLIGHT_REQUESTS',
+    'TASK_TIME',
+    'metrics',
+    'metrics_registry',
+    'observe_result',
+)
+
+
+FETCH_TIME = Histogram(
+    'fossnews_gatherer_fetch_seconds', 'Source fetching time.', ['source', 'host'],
+    buckets=(.05, .1, .25, .5, 1., 2.5, 5., 10., 30., 60.),
+)
+ENTRIES = Counter('fossnews_gatherer_entries', 'Gathered source entries by status.', ['status'])
+INFLIGHT_REQUESTS = Gauge('fossnews_gatherer_inflight_requests', 'HTTP requests in progress.',
+                          multiprocess_mode='livesum')
+TASK_TIME = Histogram(
+    'fossnews_celery_task_seconds', 'Celery task execution time.', ['task', 'state'],
+    buckets=(.1, .5, 1., 5., 10., 30., 60., 120., 300., 600., 1800.),
+)
+
+
+def observe_result(result: GatheringResult):
+    """
+    Record metrics of the finished gathering.
+
+    :param result: gathering result.
+    """
+    if result.source is not None and result.fetch_time:
+        host = urlsplit(result.source.url).hostname or ''
+        FETCH_TIME.labels(result.source.title, host).observe(result.fetch_time)
+
+    for status, count in [
+        ('parsed', result.total_count - result.errors_count),
+        ('saved', result.saved_count),
+        ('filtered', result.filtered_count),
+        ('errors', result.errors_count),
+    ]:
+        if count > 0:
+            ENTRIES.labels(status).inc(count)
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Get registry of metrics of all processes (in multiprocess mode) or of the current process."""
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+
+    return REGISTRY
+
+
+def metrics(request: HttpRequest) -> HttpResponse:
+    """Metrics in Prometheus text format."""
+    return HttpResponse(generate_latest(metrics_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,62 @@
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from django.db import migrations, models
+
+
+# Frozen copy of URL normalization at the time of this migration (see `fossnews.gatherer.parsers.urlhash`):
+# migration results must not depend on the current code
+TRACKING_PARAMS = frozenset({
+    '_openstat', 'dclid', 'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid', 'msclkid', 'yclid',
+})
+
+
+def urlhash(url: str) -> str:
+    parsed = urlparse(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not (k.startswith('utm_') or k in TRACKING_PARAMS)
+    ]
+    parsed = urlparse(urlunparse(parsed._replace(query=urlencode(query))))
+    url = urlunparse(parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        query=urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True))),
+        fragment='',
+    ))
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def fill_url_hash(apps, schema_editor):
+    News = apps.get_model('gatherer', 'News')
+
+    seen = set()
+    news = []
+    for n in News.objects.order_by('pk').only('pk', 'url').iterator():
+        n.url_hash = urlhash(n.url)
+        if n.url_hash not in seen:  # Already saved duplicates keep `NULL` hash
+            seen.add(n.url_hash)
+            news.append(n)
+
+    News.objects.bulk_update(news, ['url_hash'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='url_hash',
+            field=models.CharField(editable=False, help_text='SHA-256 of normalized news URL.', max_length=64, null=True),
+        ),
+        migrations.RunPython(fill_url_hash, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='news',
+            name='url_hash',
+            field=models.CharField(editable=False, help_text='SHA-256 of normalized news URL.', max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0002_news_url_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='etag',
+            field=models.CharField(blank=True, editable=False, help_text='`ETag` of the last fetched source content.', max_length=256, null=True),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='last_modified',
+            field=models.CharField(blank=True, editable=False, help_text='`Last-Modified` of the last fetched source content.', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='SHA-256 of the last fetched source content.', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='not_modified',
+            field=models.BooleanField(default=False, help_text='Source content has not been modified since the last gathering.'),
+        ),
+    ]
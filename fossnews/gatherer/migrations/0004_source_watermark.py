@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0003_source_conditional_fetch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='watermark_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='Publication date of the newest gathered entry.', null=True),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='seen_guids',
+            field=models.JSONField(default=list, editable=False, help_text='GUIDs of the recently gathered entries.'),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0004_source_watermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='minhash',
+            field=models.BinaryField(editable=False, help_text='MinHash signature of title and summary.', null=True),
+        ),
+    ]
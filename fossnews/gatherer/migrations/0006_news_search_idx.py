@@ -0,0 +1,35 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.search import SearchConfig, SearchVector
+from django.db import migrations, models
+
+
+# Frozen copy of the search vector at the time of this migration (see `fossnews.gatherer.models.news_search_vector`):
+# migration results must not depend on the current code
+def search_config() -> models.Case:
+    return models.Case(
+        models.When(language='en', then=SearchConfig('english')),
+        models.When(language='ru', then=SearchConfig('russian')),
+        default=SearchConfig('simple'),
+        output_field=models.TextField(),
+    )
+
+
+def news_search_vector() -> SearchVector:
+    return (
+        SearchVector('title', config=search_config(), weight='A') +
+        SearchVector('summary', 'content', config=search_config(), weight='B')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0005_news_minhash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=django.contrib.postgres.indexes.GinIndex(news_search_vector(), name='gatherer_news_search_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0006_news_search_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gatheringresult',
+            index=models.Index(fields=['finished_at', 'id'], name='gatherer_ga_finishe_1c4d9f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['gathered_at', 'id'], name='gatherer_ne_gathere_4441f0_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+def fill_updated_at(apps, schema_editor):
+    News = apps.get_model('gatherer', 'News')
+    News.objects.update(updated_at=models.F('gathered_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0007_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='updated_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='news',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['updated_at', 'id'], name='gatherer_ne_updated_f2377b_idx'),
+        ),
+    ]
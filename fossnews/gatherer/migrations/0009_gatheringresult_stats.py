@@ -0,0 +1,51 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0008_news_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='fetch_time',
+            field=models.FloatField(default=0.0, help_text='Source fetching time (in seconds).'),
+        ),
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='parse_time',
+            field=models.FloatField(default=0.0, help_text='Source parsing time (in seconds).'),
+        ),
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='enrich_time',
+            field=models.FloatField(default=0.0, help_text='News parsing time (in seconds).'),
+        ),
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='dedup_time',
+            field=models.FloatField(default=0.0, help_text='Near-duplicates search time (in seconds), share of batches.'),
+        ),
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='insert_time',
+            field=models.FloatField(default=0.0, help_text='News saving time (in seconds), share of batches.'),
+        ),
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='response_bytes',
+            field=models.BigIntegerField(default=0, help_text='Size of all responses (source and news pages).'),
+        ),
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='http_status',
+            field=models.PositiveSmallIntegerField(blank=True, null=True, help_text='Source response HTTP status.'),
+        ),
+        migrations.AddField(
+            model_name='gatheringresult',
+            name='retry_count',
+            field=models.IntegerField(default=0, help_text='The number of retried requests.'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gatherer', '0009_gatheringresult_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='change_xid',
+            field=models.BigIntegerField(default=0, editable=False, help_text='ID of the last transaction that added or updated news (set by DB).'),
+        ),
+        migrations.RunSQL(
+            """
+            CREATE FUNCTION gatherer_news_change_xid() RETURNS trigger AS $$
+            BEGIN
+                NEW.change_xid := pg_current_xact_id()::text::bigint;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER gatherer_news_change_xid BEFORE INSERT OR UPDATE ON gatherer_news
+            FOR EACH ROW EXECUTE FUNCTION gatherer_news_change_xid();
+            """,
+            """
+            DROP TRIGGER gatherer_news_change_xid ON gatherer_news;
+            DROP FUNCTION gatherer_news_change_xid();
+            """,
+        ),
+        migrations.RemoveIndex(
+            model_name='news',
+            name='gatherer_ne_updated_f2377b_idx',
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['change_xid', 'id'], name='gatherer_ne_change__6086a7_idx'),
+        ),
+    ]
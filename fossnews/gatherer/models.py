@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchConfig, SearchVector
 from django.db import models
 from django.utils.translation import get_language_info, gettext_lazy as _
 
@@ -16,6 +18,43 @@ class Language(models.TextChoices):
     RU = 'ru', get_language_info('ru')['name_translated']
 
 
+# PostgreSQL full text search configurations by language
+SEARCH_CONFIGS = {
+    Language.EN: 'english',
+    Language.RU: 'russian',
+}
+
+
+def search_config(field: str = 'language') -> models.Case:
+    """
+    Full text search configuration by language field.
+
+    Configurations are `regconfig` constants, so expressions using them can be indexed.
+
+    :param field: language field name.
+    :return: Search configuration expression.
+    """
+    return models.Case(
+        *(models.When(**{field: language}, then=SearchConfig(config)) for language, config in SEARCH_CONFIGS.items()),
+        default=SearchConfig('simple'),
+        output_field=models.TextField(),
+    )
+
+
+def news_search_vector() -> SearchVector:
+    """
+    News full text search vector: title is weighted over summary and content.
+
+    It's indexed by GIN index, so use it as is to search news.
+
+    :return: Search vector expression.
+    """
+    return (
+        SearchVector('title', config=search_config(), weight='A') +
+        SearchVector('summary', 'content', config=search_config(), weight='B')
+    )
+
+
 class SourceType(models.TextChoices):
     RSS = 'rss', _('RSS')
     HTML = 'html', _('HTML')
@@ -28,6 +67,15 @@ class Source(models.Model):
     url = models.URLField(unique=True)
     type = models.CharField(max_length=8, choices=SourceType.choices, default=SourceType.RSS)
     language = models.CharField(max_length=2, choices=Language.choices, default=Language.EN)
+    etag = models.CharField(max_length=256, blank=True, null=True, editable=False,
+                            help_text='`ETag` of the last fetched source content.')
+    last_modified = models.CharField(max_length=64, blank=True, null=True, editable=False,
+                                     help_text='`Last-Modified` of the last fetched source content.')
+    content_hash = models.CharField(max_length=64, blank=True, null=True, editable=False,
+                                    help_text='SHA-256 of the last fetched source content.')
+    watermark_at = models.DateTimeField(blank=True, null=True, editable=False,
+                                        help_text='Publication date of the newest gathered entry.')
+    seen_guids = models.JSONField(default=list, editable=False, help_text='GUIDs of the recently gathered entries.')
 
     def __str__(self):
         return self.title
@@ -50,23 +98,45 @@ class GatheringResult(models.Model):
     filtered_count = models.IntegerField(default=0)
     errors_count = models.IntegerField(default=0)
     errors = models.TextField(blank=True, null=True)
+    not_modified = models.BooleanField(default=False, help_text='Source content has not been modified since the last gathering.')
+    fetch_time = models.FloatField(default=0., help_text='Source fetching time (in seconds).')
+    parse_time = models.FloatField(default=0., help_text='Source parsing time (in seconds).')
+    enrich_time = models.FloatField(default=0., help_text='News parsing time (in seconds).')
+    dedup_time = models.FloatField(default=0., help_text='Near-duplicates search time (in seconds), share of batches.')
+    insert_time = models.FloatField(default=0., help_text='News saving time (in seconds), share of batches.')
+    response_bytes = models.BigIntegerField(default=0, help_text='Size of all responses (source and news pages).')
+    http_status = models.PositiveSmallIntegerField(blank=True, null=True, help_text='Source response HTTP status.')
+    retry_count = models.IntegerField(default=0, help_text='The number of retried requests.')
 
     def __str__(self):
-        return f'Gathering from {self.source.title} at {self.finished_at}'
+        return f'Gathering from {self.source} at {self.finished_at}'
 
     def to_dict(self) -> dict:
         return dict(
-            source=self.source.title,
+            id=self.pk,
+            source=self.source.title if self.source else None,
             started_at=self.started_at,
             finished_at=self.finished_at,
             total_count=self.total_count,
             saved_count=self.saved_count,
             filtered_count=self.filtered_count,
             errors_count=self.errors_count,
+            not_modified=self.not_modified,
+            fetch_time=self.fetch_time,
+            parse_time=self.parse_time,
+            enrich_time=self.enrich_time,
+            dedup_time=self.dedup_time,
+            insert_time=self.insert_time,
+            response_bytes=self.response_bytes,
+            http_status=self.http_status,
+            retry_count=self.retry_count,
         )
 
     class Meta:
         ordering = ['-finished_at', 'source__title']
+        indexes = [
+            models.Index(fields=('finished_at', 'id')),
+        ]
 
 
 class ContentType(models.TextChoices):
@@ -82,6 +152,8 @@ class News(models.Model):
     title = models.CharField(max_length=256)
     author = models.CharField(max_length=256, blank=True, null=True)
     url = models.URLField()
+    url_hash = models.CharField(max_length=64, unique=True, null=True, editable=False,
+                                help_text='SHA-256 of normalized news URL.')
     origin = models.URLField(blank=True, null=True)
     summary = models.TextField(blank=True, null=True)
     content = models.TextField(blank=True, null=True)
@@ -89,7 +161,11 @@ class News(models.Model):
     language = models.CharField(max_length=2, choices=Language.choices, default=Language.EN)
     published_at = models.DateTimeField()
     gathered_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+    change_xid = models.BigIntegerField(default=0, editable=False,
+                                        help_text='ID of the last transaction that added or updated news (set by DB).')
     gathering = models.ForeignKey('gatherer.GatheringResult', null=True, on_delete=models.SET_NULL)
+    minhash = models.BinaryField(null=True, editable=False, help_text='MinHash signature of title and summary.')
 
     def __str__(self):
         return f'{self.title} ({self.url})'
@@ -101,6 +177,9 @@ class Meta:
         indexes = [
             models.Index(fields=('title',)),
             models.Index(fields=('url',)),
+            models.Index(fields=('gathered_at', 'id')),
+            models.Index(fields=('change_xid', 'id')),
+            GinIndex(news_search_vector(), name='gatherer_news_search_idx'),
         ]
 
 
@@ -0,0 +1,82 @@
+"""Lazy `spaCy`_ models registry.
+
+.. _spaCy: https://spacy.io/
+"""
+import logging
+from collections.abc import Iterable, Iterator
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+from .meta import Singleton
+from .models import Language, News
+
+
+if TYPE_CHECKING:
+    from spacy.language import Language as Model
+    from spacy.tokens import Doc
+
+
+__all__ = ('NlpModels', 'nlp_models')
+
+
+log = logging.getLogger('fossnews.nlp')
+
+
+class NlpModels(metaclass=Singleton):
+    """
+    `spaCy` models by language.
+
+    Neither `spaCy` nor its models are loaded until a model is requested for the first time,
+    so processes that don't do NLP never pay for it. Each model is loaded once per process.
+    Model names are set in ``SPACY_MODELS`` setting.
+    """
+
+    def __init__(self):
+        self._models: dict[Language, 'Model'] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, language: Language | str) -> 'Model':
+        language = Language(language)
+
+        if language not in self._models:
+            with self._lock:
+                if language not in self._models:
+                    import spacy
+
+                    log.info('Loading spaCy model %s', settings.SPACY_MODELS[language])
+                    self._models[language] = spacy.load(settings.SPACY_MODELS[language])
+
+        return self._models[language]
+
+    def preload(self, languages: Iterable[Language | str]):
+        """
+        Load models in advance, e.g. at worker start.
+
+        :param languages: models languages.
+        """
+        for language in languages:
+            _ = self[language]
+
+    def pipe(
+        self,
+        news: Iterable[News],
+        language: Language | str,
+        batch_size: int = 64,
+        n_process: int = 1,
+    ) -> Iterator[tuple['Doc', News]]:
+        """
+        Process news texts in batches.
+
+        :param news: news in the same language; may be a lazy iterator (e.g. `QuerySet.iterator()`).
+        :param language: news language.
+        :param batch_size: the number of texts to process at once.
+        :param n_process: the number of processes to use.
+        :return: Iterator of processed documents with their news.
+        """
+        texts = ((f'{n.title}\n\n{n.summary or ""}', n) for n in news)
+        return self[language].pipe(texts, as_tuples=True, batch_size=batch_size, n_process=n_process)
+
+
+nlp_models = NlpModels()
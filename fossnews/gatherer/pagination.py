@@ -0,0 +1,26 @@
+from rest_framework.pagination import CursorPagination
+
+
+__all__ = (
+    'GatheringResultPagination',
+    'NewsPagination',
+)
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination.
+
+    Unlike page number pagination, page query time doesn't depend on page depth,
+    and pages are stable while new rows are inserted.
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
+class GatheringResultPagination(KeysetPagination):
+    ordering = ('-finished_at', '-id')
+
+
+class NewsPagination(KeysetPagination):
+    ordering = ('-gathered_at', '-id')
@@ -1,53 +1,266 @@
 import asyncio
+import hashlib
 import logging
 import re
-from collections.abc import Awaitable, Callable
-from datetime import datetime
-from typing import final
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from http import HTTPStatus
+from io import BytesIO
+from itertools import islice
+from typing import Generic, NamedTuple, TypeVar, final
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunparse
 
 from aiohttp import ClientSession
 from aiohttp_retry import RetryClient
-from feedparser import FeedParserDict, parse as parse_feed
+from feedparser import parse as parse_feed
+from lxml import etree
 
-from .datetime import to_datetime
+from .datetime import parse_feed_datetime, to_datetime
 from .meta import Singleton
 from .models import ContentType, Language, News, SourceType, Source
+from .stats import set_http_status, stage_timer
+from .throttling import ThrottledClient
 
 
 __all__ = (
     'Client',
+    'NotModified',
     'SourceParsers',
+    'advance_watermark',
+    'feed_iterparse',
+    'news_parsers_limit',
+    'parser_executor',
+    'urlclean',
+    'urlhash',
 )
 
 
 log = logging.getLogger('fossnews.parser')
 
 # Type aliases
-Client = ClientSession | RetryClient
+Client = ClientSession | RetryClient | ThrottledClient
 NewsParser = Callable[[Client, News], Awaitable[News]]
 SourceParser = Callable[[Client, Source], Awaitable[list[News]]]
 UrlPattern = re.Pattern[str]
-NewsParserPattern = tuple[UrlPattern, NewsParser]
-NewsParsersList = list[NewsParserPattern]
+T = TypeVar('T')
+
+# Leading global inline flags of pattern, e.g. `(?i)`
+INLINE_FLAGS = re.compile(r'^(?:\(\?[aiLmsux]+\))+')
+
+# Named groups and backreferences that break combining patterns into a single regex
+UNSUPPORTED_SYNTAX = re.compile(r'\(\?P[<=]|(?<!\\)\\[1-9]')
+
+# Literal host prefix of URL pattern, e.g. `^https://www\.example\.com/`
+HOST_PATTERN = re.compile(r'^\^https?\??://(?P<host>(?:[a-z0-9-]|\\\.)+)(?:/|\$)', re.IGNORECASE)
+
+# Tokens of pattern to find its top-level alternation: escapes, character classes, parentheses, alternation, the rest
+PATTERN_TOKEN = re.compile(r'\\.|\[\^?\]?(?:\\.|[^\]\\])*\]|[()|]|[^\\\[()|]+', re.DOTALL)
+
+# Executor for CPU-bound parsing (feeds are parsed in the event loop if not set)
+parser_executor: ContextVar[Executor | None] = ContextVar('parser_executor', default=None)
+
+# The number of news of a source parsed concurrently
+news_parsers_limit: ContextVar[int] = ContextVar('news_parsers_limit', default=10)
+
+# Parse feeds with streaming parser that stops at the first seen entry (see :func:`iterparse_feed_entries`)
+feed_iterparse: ContextVar[bool] = ContextVar('feed_iterparse', default=False)
+
+# The number of the recently seen entries GUIDs to keep in the source watermark
+SEEN_GUIDS_LIMIT = 200
+
+# Feed XML names
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+ATOM_ENTRY = f'{{{ATOM_NS}}}entry'
+RSS_ITEM = 'item'
+RSS_CONTENT = '{http://purl.org/rss/1.0/modules/content/}encoded'
+DC_CREATOR = '{http://purl.org/dc/elements/1.1/}creator'
+DC_DATE = '{http://purl.org/dc/elements/1.1/}date'
+XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+# Tracking query parameters (besides `UTM parameters`_)
+TRACKING_PARAMS = frozenset({
+    '_openstat', 'dclid', 'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid', 'msclkid', 'yclid',
+})
+
+
+def is_tracking_param(name: str) -> bool:
+    return name.startswith('utm_') or name in TRACKING_PARAMS
+
+
+class NotModified(Exception):
+    """Source content has not been modified since the last gathering."""
+
+    def __init__(self, source: Source):
+        super().__init__(f'Source {source.title} has not been modified')
+        self.source = source
+
+
+class FeedEntry(NamedTuple):
+    """Feed entry compact enough to be passed between processes."""
+    guid: str
+    link: str
+    title: str
+    author: str
+    summary: str
+    content: str | None
+    published_at: datetime
+
+
+async def run_parser(f: Callable, *args):
+    """
+    Run CPU-bound parser function in :data:`parser_executor` (if any).
+
+    :param f: parser function; it must be picklable for a process pool executor, as well as its arguments and result.
+    :param args: parser function arguments.
+    :return: Parser function result.
+    """
+    executor = parser_executor.get()
+    if executor is None:
+        return f(*args)
+
+    return await asyncio.get_running_loop().run_in_executor(executor, f, *args)
 
 
 def urlclean(url: str) -> str:
     """
-    Remove `UTM parameters`_ from URL.
+    Remove `UTM parameters`_ and other tracking parameters from URL.
 
     .. _UTM parameters: https://en.wikipedia.org/wiki/UTM_parameters
 
     :param url: URL to clean.
-    :return: Cleaned URL without UTM parameters.
+    :return: Cleaned URL without tracking parameters.
     """
     parsed = urlparse(url)
-    query = parse_qs(parsed.query, keep_blank_values=True)
-    query = {k: v for k, v in query.items() if not k.startswith('utm_')}
-    parsed = parsed._replace(query=urlencode(query, doseq=True))
+    query = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if not is_tracking_param(k)]
+    parsed = parsed._replace(query=urlencode(query))
     return urlunparse(parsed)
 
 
+def urlnormalize(url: str) -> str:
+    """
+    Normalize URL for duplicates detection.
+
+    Lowercase scheme and host, drop fragment, sort query and remove tracking parameters.
+
+    :param url: URL to normalize.
+    :return: Normalized URL.
+    """
+    parsed = urlparse(urlclean(url.strip()))
+    return urlunparse(parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        query=urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True))),
+        fragment='',
+    ))
+
+
+def urlhash(url: str) -> str:
+    """
+    Get URL fingerprint: SHA-256 hex digest of the normalized URL.
+
+    :param url: URL.
+    :return: URL fingerprint.
+    """
+    return hashlib.sha256(urlnormalize(url).encode()).hexdigest()
+
+
+def has_top_level_alternation(pattern: str) -> bool:
+    """
+    Check if pattern is an alternation, e.g. ``^https://a\\.com/|^https://b\\.com/``.
+
+    :param pattern: valid regular expression pattern.
+    :return: Whether pattern has ``|`` outside of groups.
+    """
+    depth = 0
+    for token in PATTERN_TOKEN.findall(pattern):
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif token == '|' and not depth:
+            return True
+    return False
+
+
+class UrlPatternIndex(Generic[T]):
+    """
+    Index of values by URL patterns.
+
+    Patterns starting with a literal host (e.g. ``^https://www\\.example\\.com/``) are indexed by host,
+    other patterns may match URL with any host. All patterns that may match URLs of a host are combined
+    into a single alternation regex of named groups. The regex is compiled on the first lookup and cached per host,
+    so lookup time doesn't depend on the number of patterns for other hosts.
+
+    As in the linear search, the first registered matching pattern wins. Leading global inline flags
+    (e.g. ``(?i)``) are turned into scoped ones. Patterns must not use named groups and numbered backreferences.
+    Top-level alternations and verbose patterns may match URL with any host (their host prefix can't be trusted).
+    """
+
+    def __init__(self):
+        self._patterns: list[tuple[str | None, str, int, T]] = []  # Host, pattern (without inline flags), flags, value
+        self._cache: dict[str, tuple[re.Pattern[str] | None, list[T]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, pattern: UrlPattern, value: T):
+        """
+        Add value by URL pattern.
+
+        :param pattern: URL pattern.
+        :param value: value.
+        :raise ValueError: if pattern uses named groups or backreferences, or it's invalid when combined with others.
+        """
+        text = INLINE_FLAGS.sub('', pattern.pattern)  # Global flags are in `pattern.flags` anyway
+        if pattern.groupindex or UNSUPPORTED_SYNTAX.search(text):
+            raise ValueError(f'URL pattern must not use named groups and backreferences: {pattern.pattern}')
+
+        try:  # Fail on registration rather than on lookup, e.g. verbose pattern ending with a comment
+            re.compile(self._alternative(0, text, pattern.flags))
+        except re.error as e:
+            raise ValueError(f'URL pattern is invalid when combined with others: {pattern.pattern}') from e
+
+        match = HOST_PATTERN.match(text)
+        if match and not pattern.flags & re.VERBOSE and not has_top_level_alternation(text):
+            host = match['host'].replace('\\', '').lower()
+        else:
+            host = None
+        self._patterns.append((host, text, pattern.flags, value))
+        self._cache.clear()
+
+    @staticmethod
+    def _alternative(i: int, pattern: str, flags: int) -> str:
+        names = {re.ASCII: 'a', re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's', re.VERBOSE: 'x'}
+        scoped = ''.join(name for flag, name in names.items() if flags & flag)
+        return f'(?P<_{i}>(?{scoped}:{pattern}))' if scoped else f'(?P<_{i}>{pattern})'
+
+    def _compile(self, host: str) -> tuple[re.Pattern[str] | None, list[T]]:
+        patterns = [(p, f, v) for h, p, f, v in self._patterns if h is None or h == host]
+        if not patterns:
+            return None, []
+
+        alternatives = [self._alternative(i, p, f) for i, (p, f, _) in enumerate(patterns)]
+        return re.compile('|'.join(alternatives)), [v for _, _, v in patterns]
+
+    def find(self, url: str) -> T | None:
+        """
+        Find value by URL.
+
+        :param url: URL.
+        :return: Value of the first matching pattern (if any).
+        """
+        host = urlsplit(url).hostname or ''
+        if host not in self._cache:
+            self._cache[host] = self._compile(host)
+
+        regex, values = self._cache[host]
+        match = regex.match(url) if regex else None
+
+        return values[int(match.lastgroup[1:])] if match else None
+
+
 @final
 class NewsParsers(metaclass=Singleton):
     @classmethod
@@ -55,22 +268,31 @@ async def _default(cls, client: Client, news: News) -> News:
         return news
 
     def __init__(self):
-        self._parsers: NewsParsersList = []
+        self._parsers: UrlPatternIndex[NewsParser] = UrlPatternIndex()
 
     def register(self, pattern: str):
         pattern = re.compile(pattern)
 
         def wrapper(f: NewsParser) -> NewsParser:
-            self._parsers.append((pattern, f))
+            self._parsers.add(pattern, f)
             return f
 
         return wrapper
 
+    def find(self, url: str) -> NewsParser | None:
+        """
+        Find parser by news URL.
+
+        :param url: news URL.
+        :return: News parser or `None` if news doesn't need parsing.
+        """
+        return self._parsers.find(url)
+
     async def parse(self, client: Client, news: News) -> News:
         """
         Find parser by URL and parse content as news.
 
-        News URL matching time: O(n).
+        News URL matching time doesn't depend on the number of parsers for other hosts (see :class:`UrlPatternIndex`).
 
         :param client: `aiohttp` client session.
         :type client: :type t: :class:ClientSession or :class:RetryClient
@@ -79,12 +301,7 @@ async def parse(self, client: Client, news: News) -> News:
         :return: Updated news.
         :rtype: :class:News
         """
-        parser = self._default
-
-        for p in self._parsers:
-            if p[0].match(news.url):
-                parser = p[1]
-                break
+        parser = self.find(news.url) or self._default
 
         return await parser(client, news)
 
@@ -107,54 +324,218 @@ def wrapper(f):
 
         return wrapper
 
-    async def parse(self, client: Client, source: Source) -> list[News | BaseException]:
+    async def parse(self, client: Client, source: Source) -> AsyncIterator[News | Exception]:
         """
-        Parse news source and return list of news.
+        Parse news source and yield news as soon as they are ready.
 
         :param client: `aiohttp` client session.
         :type client: :type t: :class:ClientSession or :class:RetryClient
         :param source: news source.
         :type source: :class:Source
-        :return: list of news.
+        :return: async iterator of news.
         """
         # Fetch news list from source
         news = await self._parsers[SourceType(source.type)](client, source)
 
-        # Fetch missing news info if needed. Result is either updated news or exception (if any).
-        news = await asyncio.gather(*[NewsParsers().parse(client, n) for n in news], return_exceptions=True)
-
-        return list(news)
+        # Pass through news that don't need parsing
+        pending = []
+        for n in news:
+            parser = NewsParsers().find(n.url)
+            if parser is None:
+                yield n
+            else:
+                pending.append((parser, n))
+
+        # Fetch missing news info with limited concurrency. Result is either updated news or exception (if any).
+        pending = iter(pending)
+        limit = max(news_parsers_limit.get(), 1)  # No news would be parsed otherwise
+        running = set()
+        try:
+            while True:
+                for parser, n in islice(pending, limit - len(running)):
+                    running.add(asyncio.ensure_future(parser(client, n)))
+                if not running:
+                    break
+
+                with stage_timer('enrich'):
+                    done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.exception() or task.result()
+        finally:
+            for task in running:
+                task.cancel()
 
 
 news_parsers = NewsParsers()
 source_parsers = SourceParsers()
 
 
-def decode_feed(feed: FeedParserDict) -> FeedParserDict:
+def advance_watermark(source: Source, entries: list[tuple[str, datetime]]):
+    """
+    Advance source watermark: the newest publication date and GUIDs of the recently seen entries.
+
+    Only the :data:`SEEN_GUIDS_LIMIT` newest GUIDs are kept. They are needed to tell apart entries
+    published at the same time as the watermark. Watermark doesn't go beyond the current time: otherwise
+    an entry dated in the future would make all entries published before its date skipped.
+
+    :param source: news source.
+    :param entries: GUIDs and publication dates of new source entries.
+    """
+    if not entries:
+        return
+
+    entries = sorted(entries, key=lambda e: e[1], reverse=True)
+    watermark_at = min(entries[0][1], datetime.now(timezone.utc))
+    if source.watermark_at is None or watermark_at > source.watermark_at:
+        source.watermark_at = watermark_at
+    source.seen_guids = ([guid for guid, _ in entries] + source.seen_guids)[:SEEN_GUIDS_LIMIT]
+
+
+def element_text(element: etree._Element | None) -> str | None:
+    """Get text of feed element; XHTML content of Atom element is serialized."""
+    if element is None:
+        return None
+    if element.get('type') == 'xhtml':
+        return ''.join(etree.tostring(child, encoding='unicode') for child in element)
+    return element.text or ''
+
+
+def rss_entry(item: etree._Element) -> FeedEntry | None:
+    link = item.findtext('link')
+    published_at = parse_feed_datetime(item.findtext('pubDate') or item.findtext(DC_DATE))
+    if not link or published_at is None:
+        return None
+
+    return FeedEntry(
+        guid=item.findtext('guid') or link,
+        link=link.strip(),
+        title=item.findtext('title') or '',
+        author=', '.join(a.text for a in item.iterfind(DC_CREATOR) if a.text) or item.findtext('author') or '',
+        summary=item.findtext('description') or '',
+        content=item.findtext(RSS_CONTENT),
+        published_at=published_at,
+    )
+
+
+def atom_entry(entry: etree._Element) -> FeedEntry | None:
+    link = next((e.get('href') for e in entry.iterfind(f'{{{ATOM_NS}}}link') if e.get('rel', 'alternate') == 'alternate'),
+                None)
+    published_at = parse_feed_datetime(entry.findtext(f'{{{ATOM_NS}}}published') or
+                                       entry.findtext(f'{{{ATOM_NS}}}updated'))
+    if not link or published_at is None:
+        return None
+
+    return FeedEntry(
+        guid=entry.findtext(f'{{{ATOM_NS}}}id') or link,
+        link=link,
+        title=element_text(entry.find(f'{{{ATOM_NS}}}title')) or '',
+        author=', '.join(a.findtext(f'{{{ATOM_NS}}}name') or '' for a in entry.iterfind(f'{{{ATOM_NS}}}author')),
+        summary=element_text(entry.find(f'{{{ATOM_NS}}}summary')) or '',
+        content=element_text(entry.find(f'{{{ATOM_NS}}}content')),
+        published_at=published_at,
+    )
+
+
+def iterparse_feed_entries(
+    body: bytes,
+    watermark_at: datetime | None,
+    seen_guids: list[str],
+) -> tuple[str | None, list[FeedEntry]] | None:
     """
-    Decode feed if it's not in UTF-8.
+    Parse `RSS 2.0` or `Atom` feed with streaming `lxml` parser and extract entries newer than the watermark.
+
+    Feed entries are expected to be ordered newest first: parsing stops at the first seen or old entry,
+    and parsed entries are freed, so the rest of a large feed costs nothing. Unlike `feedparser`,
+    HTML of entries is not sanitized.
 
-    :param feed: parsed feed.
-    :type feed: :class:FeedParserDict
-    :return: Decoded feed in UTF-8.
-    :rtype: :class:FeedParserDict
+    :param body: feed content.
+    :param watermark_at: source watermark publication date.
+    :param seen_guids: GUIDs of the recently seen source entries.
+    :return: Feed language (if any) and new feed entries, or `None` if the feed is not supported
+        (e.g. entry has no link or date, or it's not well-formed XML).
     """
-    encoding = feed.encoding
+    seen_guids = set(seen_guids)
+    language, entries, count = None, [], 0
+
+    try:
+        for _, element in etree.iterparse(BytesIO(body), tag=(RSS_ITEM, ATOM_ENTRY), resolve_entities=False):
+            if not count:  # Channel elements preceding entries are parsed already
+                root = element.getroottree().getroot()
+                language = root.findtext('channel/language') if element.tag == RSS_ITEM else root.get(XML_LANG)
+            count += 1
+
+            entry = rss_entry(element) if element.tag == RSS_ITEM else atom_entry(element)
+            if entry is None:
+                return None
+            if entry.guid in seen_guids or (watermark_at is not None and entry.published_at < watermark_at):
+                break  # The rest of entries are older
+
+            entries.append(entry)
+            element.clear(keep_tail=True)
+    except etree.XMLSyntaxError:
+        return None
+
+    return (language, entries) if count else None
+
+
+def parse_feed_entries(
+    body: bytes,
+    content_type: str | None,
+    watermark_at: datetime | None,
+    seen_guids: list[str],
+    iterparse: bool = False,
+) -> tuple[str | None, list[FeedEntry]]:
+    """
+    Parse feed and extract entries newer than the watermark.
 
-    if encoding and encoding != 'utf-8':
-        def _decode(value: str | list | FeedParserDict) -> str | list | FeedParserDict:
-            if isinstance(value, str):
-                return value.encode(encoding=encoding, errors='ignore').decode(encoding='utf-8', errors='ignore')
-            elif isinstance(value, list):
-                return [_decode(v) for v in value]
-            elif isinstance(value, FeedParserDict):
-                for k, v in value.items():
-                    value[k] = _decode(v)
-            return value
+    Feed is parsed from bytes, so its encoding is detected (from XML declaration or HTTP header) only once.
 
-        feed = _decode(feed)
+    :param body: feed content.
+    :param content_type: feed response `Content-Type` (with charset, if any).
+    :param watermark_at: source watermark publication date.
+    :param seen_guids: GUIDs of the recently seen source entries.
+    :param iterparse: try :func:`iterparse_feed_entries` first.
+    :return: Feed language (if any) and new feed entries.
+    """
+    if iterparse and (parsed := iterparse_feed_entries(body, watermark_at, seen_guids)) is not None:
+        return parsed
+
+    feed = parse_feed(BytesIO(body), response_headers={'content-type': content_type} if content_type else None)
+    seen_guids = set(seen_guids)
+    entries = []
+
+    for entry in feed.entries:
+        guid = entry.get('id') or entry.link
+        # Atom entries may have update date only (the same as in `atom_entry`)
+        published_at = to_datetime(entry.get('published_parsed') or entry.get('updated_parsed'))
+        if guid in seen_guids or (watermark_at is not None and published_at < watermark_at):
+            continue
+
+        entries.append(FeedEntry(
+            guid=guid,
+            link=entry.link,
+            title=entry.title,
+            author=', '.join(a.name for a in entry.get('authors', [])),
+            summary=entry.summary,
+            content='\n'.join(c.value for c in entry.content) if 'content' in entry else None,
+            published_at=published_at,
+        ))
+
+    return feed.feed.get('language'), entries
+
+
+def feed_language(tag: str | None, default: Language) -> Language:
+    """
+    Get language by feed language tag, e.g. ``en-us`` or ``ru_RU`` (only the primary language subtag is used).
 
-    return feed
+    :param tag: feed language tag.
+    :param default: default language.
+    :return: Language, or the default one if the tag is not set or the language is not supported.
+    """
+    try:
+        return Language(re.split(r'[-_]', tag or '', maxsplit=1)[0].strip().lower())
+    except ValueError:
+        return default
 
 
 @source_parsers.register(SourceType.RSS)
@@ -165,27 +546,59 @@ async def feed_parser(client: Client, source: Source) -> list[News]:
     .. _RSS: https://www.rssboard.org/rss-specification
     .. _Atom: https://www.rfc-editor.org/rfc/rfc5023
 
+    Feed is fetched conditionally: HTTP cache validators and content hash of the last fetched feed
+    are stored in the source. Only entries newer than the source watermark are turned into news.
+    HTTP cache validators are updated in the source here. It's up to the caller to advance the source watermark
+    with GUIDs (`guid` attribute) and publication dates of the saved news, and to save the source state.
+
+    Feed is parsed from raw bytes in :data:`parser_executor` (if any) not to block the event loop.
+
     :param client: `aiohttp` client session.
     :param source: news source.
     :return: List of news from RSS/Atom feed.
+    :raise NotModified: if the feed has not been modified since the last gathering.
     """
-    async with client.get(source.url) as response:
-        feed = decode_feed(parse_feed(await response.text()))
-
-    for attr in ['title', 'language']:
-        if attr not in feed:
-            setattr(feed, attr, getattr(source, attr))
-
-    news = [News(
-        url=urlclean(entry.link),
-        title=entry.title,
-        author=', '.join(a.name for a in entry.get('authors', [])),
-        summary=entry.summary,
-        content=entry.get('content'),
-        language=Language(feed.language),
-        published_at=to_datetime(entry.published_parsed),
-        gathered_at=datetime.utcnow(),
-    ) for entry in feed.entries]
+    headers = {}
+    if source.etag:
+        headers['If-None-Match'] = source.etag
+    if source.last_modified:
+        headers['If-Modified-Since'] = source.last_modified
+
+    with stage_timer('fetch'):
+        async with client.get(source.url, headers=headers) as response:
+            set_http_status(response.status)
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                raise NotModified(source)
+
+            body = await response.read()
+            content_hash = hashlib.sha256(body).hexdigest()
+            source.etag = response.headers.get('ETag')
+            source.last_modified = response.headers.get('Last-Modified')
+            if content_hash == source.content_hash:
+                raise NotModified(source)
+
+            source.content_hash = content_hash
+            content_type = response.headers.get('Content-Type')
+
+    with stage_timer('parse'):
+        language, entries = await run_parser(
+            parse_feed_entries, body, content_type, source.watermark_at, source.seen_guids, feed_iterparse.get(),
+        )
+
+        news = []
+        for entry in entries:
+            n = News(
+                url=urlclean(entry.link),
+                title=entry.title,
+                author=entry.author,
+                summary=entry.summary,
+                content=entry.content,
+                language=feed_language(language, Language(source.language)),
+                published_at=entry.published_at,
+                gathered_at=datetime.utcnow(),
+            )
+            n.guid = entry.guid  # To advance the source watermark once the news is saved
+            news.append(n)
 
     return news
 
@@ -0,0 +1,378 @@
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterable
+from datetime import datetime, timedelta
+from time import perf_counter
+from traceback import format_exception
+
+from aiohttp import ClientResponseError
+from asgiref.sync import sync_to_async
+from django.db import DatabaseError, transaction
+
+from ..classifier.models import Classification, NewsStatus
+from .cache import abump_version
+from .metrics import observe_result
+from .models import GatheringResult, News, Source
+from .parsers import Client, NotModified, SourceParsers, advance_watermark, run_parser, urlhash
+from .similarity import MinHashIndex, minhashes
+from .stats import gathering_result
+
+
+__all__ = (
+    'GatheringPipeline',
+    'classify_duplicates',
+)
+
+
+log = logging.getLogger('fossnews.gatherer')
+source_parsers = SourceParsers()
+
+
+def filter_news(news: list[News], seen: set[str]) -> list[News]:
+    """
+    Filter out duplicate news.
+
+    News is a duplicate if its normalized URL has already been seen during the current gathering run
+    (e.g. the same story from another source). Duplicates of news already in the DB are skipped on insert
+    by the unique index on :attr:`News.url_hash`.
+
+    :param news: news to filter.
+    :param seen: URL hashes seen during the current gathering run; updated in place.
+    :return: Unique news.
+    """
+    unique = []
+    for n in news:
+        n.url_hash = urlhash(n.url)
+        if n.url_hash not in seen:
+            seen.add(n.url_hash)
+            unique.append(n)
+
+    # TODO: add filters
+    return unique
+
+
+def truncate_fields(n: News) -> News:
+    """
+    Truncate news text fields to their maximum length (feeds don't limit e.g. title length).
+
+    :param n: news.
+    :return: The same news.
+    """
+    for field in ('title', 'author'):
+        max_length = News._meta.get_field(field).max_length
+        if (value := getattr(n, field)) and len(value) > max_length:
+            setattr(n, field, f'{value[:max_length - 1]}…')
+    return n
+
+
+def update_source(source: Source):
+    """
+    Save source state updated by parser: HTTP cache validators and watermark.
+
+    :param source: news source.
+    """
+    Source.objects.filter(pk=source.pk).update(
+        etag=source.etag,
+        last_modified=source.last_modified,
+        content_hash=source.content_hash,
+        watermark_at=source.watermark_at,
+        seen_guids=source.seen_guids,
+    )
+
+
+@sync_to_async
+def save_news(news: list[News], duplicates: list[News], sources: list[Source]):
+    """
+    Save news and advance state of the completely gathered sources atomically.
+
+    :param news: news to save.
+    :param duplicates: near-duplicates among news to save.
+    :param sources: sources gathered completely and without errors (including all their news batches saved).
+    """
+    with transaction.atomic():
+        News.objects.bulk_create(news, ignore_conflicts=True)
+
+        if duplicates:  # Saved news have no PKs, so find them (and only them) by URL hash
+            pks = News.objects.filter(
+                url_hash__in=[n.url_hash for n in duplicates],
+                gathering__in={n.gathering for n in duplicates},
+            ).values_list('pk', flat=True)
+            Classification.objects.bulk_create(
+                [Classification(news_id=pk, status=NewsStatus.DUPLICATE) for pk in pks],
+                ignore_conflicts=True,
+            )
+
+        for source in sources:
+            update_source(source)
+
+
+def classify_duplicates(gatherings: list[int], threshold: float, window: int, chunk_size: int = 1000) -> int:
+    """
+    Classify near-duplicates among news of concurrent gatherings (e.g. shards) as :attr:`NewsStatus.DUPLICATE`.
+
+    Each gathering pipeline finds near-duplicates only among news it has seen, so news of concurrent gatherings
+    are checked again: in the order they were saved, against news gathered before during the window
+    and the earlier news of the gatherings. Already classified news are skipped.
+
+    :param gatherings: gathering result IDs.
+    :param threshold: minimum similarity of near-duplicate news.
+    :param window: the number of days to look for near-duplicates in.
+    :param chunk_size: the number of rows fetched at once.
+    :return: The number of found near-duplicates.
+    """
+    index = MinHashIndex(threshold)
+    news = News.objects.filter(minhash__isnull=False)
+    before = news.filter(gathered_at__gte=datetime.utcnow() - timedelta(days=window)).exclude(gathering__in=gatherings)
+    for signature in before.values_list('minhash', flat=True).iterator(chunk_size=chunk_size):
+        index.add(signature)
+
+    duplicates = []
+    gathered = news.filter(gathering__in=gatherings).order_by('pk').values_list('pk', 'minhash')
+    for pk, signature in gathered.iterator(chunk_size=chunk_size):
+        if index.has_duplicate(signature):
+            duplicates.append(Classification(news_id=pk, status=NewsStatus.DUPLICATE))
+        index.add(signature)
+
+    Classification.objects.bulk_create(duplicates, batch_size=chunk_size, ignore_conflicts=True)
+    return len(duplicates)
+
+
+def add_stage_time(news: list[News], stage: str, duration: float):
+    """
+    Share duration of a batch processing stage between gathering results by the number of their news in the batch.
+
+    :param news: news batch.
+    :param stage: stage name.
+    :param duration: stage duration (in seconds).
+    """
+    field = f'{stage}_time'
+    for result, count in Counter(n.gathering for n in news).items():
+        setattr(result, field, getattr(result, field) + duration * count / len(news))
+
+
+def add_error(result: GatheringResult, e: BaseException):
+    result.errors_count += 1
+    error = ''.join(format_exception(e))
+    result.errors = f'{result.errors}\n{error}' if result.errors else error
+
+
+class GatheringPipeline:
+    """
+    Streaming news gathering pipeline.
+
+    Sources are gathered by a fixed number of workers. Each worker fetches and parses a source and puts its news
+    to the bounded news queue followed by the source gathering result (end of source marker). The writer filters
+    duplicates and saves news in fixed-size batches. Bounded queues apply backpressure to the workers,
+    so memory usage doesn't depend on the number of sources.
+
+    Source state (HTTP cache validators, watermark) is saved only if the source is gathered without errors,
+    so news that failed to be parsed or saved are gathered again next time.
+
+    Near-duplicates of news gathered during the last days (the same story under different URLs) are saved
+    as well, but classified as :attr:`NewsStatus.DUPLICATE`. Concurrent pipelines don't see each other's news,
+    so their near-duplicates are classified afterwards by :func:`classify_duplicates`.
+
+    .. code-block:: text
+
+        sources --> [worker: fetch, parse, enrich] x N --> news queue --> [writer: dedup, batch insert] --> DB
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        workers: int,
+        queue_size: int,
+        batch_size: int,
+        duplicate_threshold: float,
+        duplicate_window: int,
+    ):
+        """
+        :param client: `aiohttp` client session.
+        :param workers: the number of sources gathered concurrently.
+        :param queue_size: news queue size.
+        :param batch_size: the number of news saved to DB at once.
+        :param duplicate_threshold: minimum similarity of near-duplicate news.
+        :param duplicate_window: the number of days to look for near-duplicates in.
+        """
+        self.client = client
+        self.workers = max(workers, 1)  # No sources would be gathered otherwise
+        self.batch_size = batch_size
+        self.duplicate_window = duplicate_window
+        self.duplicates = MinHashIndex(duplicate_threshold)
+        self.sources: asyncio.Queue[Source | None] = asyncio.Queue(maxsize=self.workers)
+        self.news: asyncio.Queue[News | GatheringResult | None] = asyncio.Queue(maxsize=queue_size)
+        self.seen: set[str] = set()  # URL hashes of news seen during this run
+        self.results: list[GatheringResult] = []
+        # Gathering results are tracked by IDs: results that failed to be saved have no PKs, so they aren't hashable
+        self.failed: set[int] = set()  # Gathering with errors: source state must not be saved
+        # GUIDs and publication dates of the gathered source entries to advance the source watermark with
+        self.entries: defaultdict[int, list[tuple[str, datetime]]] = defaultdict(list)
+
+    async def run(self, sources: AsyncIterable[Source]) -> list[GatheringResult]:
+        """
+        Gather news from sources.
+
+        :param sources: news sources.
+        :return: List of gathering results by source.
+        """
+        await self.load_signatures()
+
+        workers = [asyncio.create_task(self.worker()) for _ in range(self.workers)]
+        tasks = [asyncio.create_task(self.produce(sources, workers)), asyncio.create_task(self.writer()), *workers]
+
+        try:  # Fail as soon as any task fails: others would be blocked on queues forever
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return self.results
+
+    async def load_signatures(self):
+        """Load signatures of the recently gathered news to find their near-duplicates."""
+        since = datetime.utcnow() - timedelta(days=self.duplicate_window)
+        news = News.objects.filter(gathered_at__gte=since, minhash__isnull=False)
+        async for signature in news.values_list('minhash', flat=True).aiterator(chunk_size=self.batch_size):
+            self.duplicates.add(signature)
+
+    async def produce(self, sources: AsyncIterable[Source], workers: list[asyncio.Task]):
+        async for source in sources:
+            await self.sources.put(source)
+        for _ in workers:
+            await self.sources.put(None)
+
+        await asyncio.gather(*workers)
+        await self.news.put(None)
+
+    async def worker(self):
+        while (source := await self.sources.get()) is not None:
+            await self.gather_from_source(source)
+
+    async def gather_from_source(self, source: Source):
+        log.info('Started news gathering from %s', source.title)
+
+        result = GatheringResult(source=source, started_at=datetime.utcnow())
+        token = gathering_result.set(result)
+
+        try:
+            await sync_to_async(result.save)()
+            async for news in source_parsers.parse(self.client, source):
+                result.total_count += 1
+                if isinstance(news, News):
+                    news.gathering = result
+                    if (guid := getattr(news, 'guid', None)) is not None:
+                        self.entries[id(result)].append((guid, news.published_at))
+                    await self.news.put(news)
+                else:
+                    add_error(result, news)
+                    self.failed.add(id(result))
+        except NotModified:
+            result.not_modified = True
+        except Exception as e:  # Report all exceptions (if any) in the task result
+            if isinstance(e, ClientResponseError):
+                result.http_status = e.status
+            add_error(result, e)
+            self.failed.add(id(result))
+        finally:
+            gathering_result.reset(token)
+
+        await self.news.put(result)
+
+    async def writer(self):
+        news, done = [], []
+
+        while (item := await self.news.get()) is not None:
+            if isinstance(item, GatheringResult):
+                done.append(item)
+            else:
+                news.extend(filter_news([truncate_fields(item)], self.seen))
+
+            # Flush full batches; finish gathering results as soon as there's nothing else to do
+            if len(news) >= self.batch_size or (done and self.news.empty()):
+                await self.flush(news, done)
+                news, done = [], []
+
+        if news or done:
+            await self.flush(news, done)
+
+    async def find_duplicates(self, news: list[News]) -> list[News]:
+        """
+        Find near-duplicates of news gathered before (including other news in the batch).
+
+        :param news: news to check.
+        :return: Near-duplicates.
+        """
+        signatures = await run_parser(minhashes, [f'{n.title}\n\n{n.summary or ""}' for n in news])
+        duplicates = []
+
+        for n, signature in zip(news, signatures):
+            n.minhash = signature
+            if signature is not None:
+                if self.duplicates.has_duplicate(signature):
+                    duplicates.append(n)
+                self.duplicates.add(signature)
+
+        return duplicates
+
+    async def save_by_source(self, news: list[News], duplicates: list[News], done: list[GatheringResult]):
+        """
+        Save news batch by source (slower, but news that failed to be saved fail only their own sources).
+
+        :param news: news to save.
+        :param duplicates: near-duplicates among news to save.
+        :param done: gathering results of the completely gathered sources.
+        """
+        for result in {id(n.gathering): n.gathering for n in news}.values():
+            try:
+                await save_news([n for n in news if n.gathering is result],
+                                [n for n in duplicates if n.gathering is result], [])
+            except DatabaseError as e:
+                add_error(result, e)
+                self.failed.add(id(result))
+
+        await save_news([], [], [r.source for r in done if id(r) not in self.failed])
+
+    async def flush(self, news: list[News], done: list[GatheringResult]):
+        """
+        Save news batch and finish completed gathering results.
+
+        :param news: news to save.
+        :param done: gathering results of the completely gathered sources.
+        """
+        sources = []
+        for result in done:
+            entries = self.entries.pop(id(result), [])
+            if id(result) not in self.failed:
+                advance_watermark(result.source, entries)
+                sources.append(result.source)
+
+        try:
+            start = perf_counter()
+            duplicates = await self.find_duplicates(news)
+            add_stage_time(news, 'dedup', perf_counter() - start)
+
+            start = perf_counter()
+            try:
+                await save_news(news, duplicates, sources)
+            except DatabaseError:  # E.g. too long URL: save news by source, so that only their source fails
+                await self.save_by_source(news, duplicates, done)
+            add_stage_time(news, 'insert', perf_counter() - start)
+        except Exception as e:  # Report saving errors in all affected results
+            for result in {id(r): r for r in [*(n.gathering for n in news), *done]}.values():
+                add_error(result, e)
+                self.failed.add(id(result))
+
+        for result in done:
+            if result.pk is not None:  # It's not saved if gathering failed to start
+                result.saved_count = await News.objects.filter(gathering=result).acount()
+            result.filtered_count = result.total_count - result.errors_count - result.saved_count
+            result.finished_at = datetime.utcnow()
+            await sync_to_async(result.save)()
+            self.results.append(result)
+            self.failed.discard(id(result))
+            observe_result(result)
+
+            log.info('Finished news gathering from %s', result.source.title)
+
+        await abump_version()  # Invalidate cached API responses
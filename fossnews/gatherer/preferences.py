@@ -1,10 +1,19 @@
+from time import monotonic
+from typing import Any
+
 from asgiref.sync import sync_to_async
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from dynamic_preferences.exceptions import CachedValueNotFound
 from dynamic_preferences.managers import PreferencesManager
+from dynamic_preferences.models import BasePreferenceModel
 from dynamic_preferences.preferences import Section
 from dynamic_preferences.registries import global_preferences_registry as registry
 from dynamic_preferences.settings import preferences_settings
-from dynamic_preferences.types import FloatPreference, IntegerPreference, StringPreference
+from dynamic_preferences.signals import preference_updated
+from dynamic_preferences.types import (
+    BooleanPreference, ChoicePreference, FloatPreference, IntegerPreference, StringPreference,
+)
 
 from .meta import bind_to
 
@@ -45,8 +54,135 @@ class ConnectionRetries(IntegerPreference):
     section = gatherer
     name = 'connection_retries'
     verbose_name = 'Connection retry attempts'
-    help_text = 'Connection retry attempts.'
+    help_text = 'Connection attempts (including the first one).'
     default = 3
+    field_kwargs = {'min_value': 1}  # `aiohttp_retry` retries infinitely with 0 attempts
+
+
+@registry.register
+class HostConnectionLimit(IntegerPreference):
+    section = gatherer
+    name = 'host_connection_limit'
+    verbose_name = 'Host connection limit'
+    help_text = 'The number of simultaneous connections to the same host.'
+    default = 4
+
+
+@registry.register
+class HostRequestDelay(FloatPreference):
+    section = gatherer
+    name = 'host_request_delay'
+    verbose_name = 'Host request delay'
+    help_text = 'Minimum number of seconds between requests to the same host.'
+    default = .5
+
+
+@registry.register
+class MaxRetryAfter(FloatPreference):
+    section = gatherer
+    name = 'max_retry_after'
+    verbose_name = 'Maximum retry delay'
+    help_text = 'Maximum number of seconds to wait before retrying a throttled request (see `Retry-After`).'
+    default = 60.
+
+
+@registry.register
+class ParserExecutor(ChoicePreference):
+    section = gatherer
+    name = 'parser_executor'
+    verbose_name = 'Parser executor'
+    help_text = ('Where to parse feeds: in the event loop, in a thread pool or in a process pool '
+                 '(only for non-daemon Celery pools; thread pool is used otherwise).')
+    choices = (
+        ('loop', 'Event loop'),
+        ('thread', 'Thread pool'),
+        ('process', 'Process pool'),
+    )
+    default = 'thread'
+
+
+@registry.register
+class ParserWorkers(IntegerPreference):
+    section = gatherer
+    name = 'parser_workers'
+    verbose_name = 'Parser workers'
+    help_text = 'The number of parser executor workers (0 means the number of CPUs).'
+    default = 0
+
+
+@registry.register
+class SourceWorkers(IntegerPreference):
+    section = gatherer
+    name = 'source_workers'
+    verbose_name = 'Source workers'
+    help_text = 'The number of sources gathered concurrently.'
+    default = 20
+    field_kwargs = {'min_value': 1}
+
+
+@registry.register
+class QueueSize(IntegerPreference):
+    section = gatherer
+    name = 'queue_size'
+    verbose_name = 'Queue size'
+    help_text = 'The maximum number of gathered news waiting to be saved.'
+    default = 1000
+
+
+@registry.register
+class BatchSize(IntegerPreference):
+    section = gatherer
+    name = 'batch_size'
+    verbose_name = 'Batch size'
+    help_text = 'The number of news saved at once.'
+    default = 500
+
+
+@registry.register
+class NewsParsersLimit(IntegerPreference):
+    section = gatherer
+    name = 'news_parsers_limit'
+    verbose_name = 'News parsers limit'
+    help_text = 'The number of news of a source parsed concurrently (if news need parsing at all).'
+    default = 10
+    field_kwargs = {'min_value': 1}
+
+
+@registry.register
+class FeedIterparse(BooleanPreference):
+    section = gatherer
+    name = 'feed_iterparse'
+    verbose_name = 'Streaming feed parsing'
+    help_text = ('Parse RSS and Atom feeds with streaming parser that stops at the first seen entry '
+                 '(feeds must be ordered newest first; unsupported feeds are parsed as usual).')
+    default = False
+
+
+@registry.register
+class DuplicateThreshold(FloatPreference):
+    section = gatherer
+    name = 'duplicate_threshold'
+    verbose_name = 'Duplicate threshold'
+    help_text = 'Minimum similarity (0..1) of title and summary of near-duplicate news.'
+    default = .6
+
+
+@registry.register
+class DuplicateWindow(IntegerPreference):
+    section = gatherer
+    name = 'duplicate_window'
+    verbose_name = 'Duplicate window'
+    help_text = 'The number of days to look for near-duplicates of gathered news in.'
+    default = 7
+
+
+@registry.register
+class ShardSize(IntegerPreference):
+    section = gatherer
+    name = 'shard_size'
+    verbose_name = 'Shard size'
+    help_text = 'The number of sources gathered by a single Celery task (0 means gather all sources in one task).'
+    default = 0
 
 
 # Patch PreferencesManager to support async queries
@@ -86,7 +222,7 @@ async def aget_db_pref(self, section, name):
 async def aget(self, key, no_cache=False):
     section, name = self.parse_lookup(key)
     if no_cache or not preferences_settings.ENABLE_CACHE:
-        return await self.aget_db_pref(section=section, name=name).value
+        return (await self.aget_db_pref(section=section, name=name)).value
 
     try:
         return self.from_cache(section, name)
@@ -96,3 +232,41 @@ async def aget(self, key, no_cache=False):
     db_pref = await self.aget_db_pref(section=section, name=name)
     self.to_cache(db_pref)
     return db_pref.value
+
+
+# In-process cache of preference sections: (model, instance, section) -> (expiration time, values)
+SECTION_CACHE_TTL = 30.  # Seconds
+section_cache: dict[tuple[str, Any, str], tuple[float, dict[str, Any]]] = {}
+
+
+@bind_to(PreferencesManager)
+async def asection(self, section: str) -> dict[str, Any]:
+    """
+    Get all preferences of the section at once.
+
+    Values are loaded with a single query and cached in the process for :data:`SECTION_CACHE_TTL`
+    (the cache is cleared when preferences are changed in this process).
+    Preferences missing in DB have default values.
+
+    :param section: section name.
+    :return: Preference values by name.
+    """
+    key = (self.model._meta.label, self.instance.pk if self.instance else None, section)
+    if (cached := section_cache.get(key)) is not None and cached[0] > monotonic():
+        return cached[1]
+
+    values = {pref.name: pref.get('default') for pref in self.registry.preferences(section=section)}
+    async for db_pref in self.queryset.filter(section=section):
+        if db_pref.name in values:
+            values[db_pref.name] = db_pref.value
+
+    section_cache[key] = monotonic() + SECTION_CACHE_TTL, values
+    return values
+
+
+@receiver(preference_updated)
+@receiver(post_save)
+@receiver(post_delete)
+def clear_section_cache(sender, **kwargs):
+    if issubclass(sender, (PreferencesManager, BasePreferenceModel)):
+        section_cache.clear()
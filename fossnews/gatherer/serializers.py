@@ -1,4 +1,4 @@
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import CharField, FloatField, ModelSerializer
 
 from .models import *
 
@@ -7,6 +7,7 @@
     'SourceSerializer',
     'GatheringResultSerializer',
     'NewsSerializer',
+    'NewsSearchSerializer',
     'DigestIssueSerializer',
     'DigestIssueLinkSerializer',
 )
@@ -27,7 +28,12 @@ class Meta:
 class NewsSerializer(ModelSerializer):
     class Meta:
         model = News
-        fields = '__all__'
+        exclude = ('minhash',)  # Internal binary near-duplicates signature
+
+
+class NewsSearchSerializer(NewsSerializer):
+    rank = FloatField(read_only=True)
+    headline = CharField(read_only=True)
 
 
 class DigestIssueSerializer(ModelSerializer):
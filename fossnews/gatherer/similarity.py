@@ -0,0 +1,112 @@
+"""
+Near-duplicate texts detection with `MinHash`_ and `LSH`_.
+
+.. _MinHash: https://en.wikipedia.org/wiki/MinHash
+.. _LSH: https://en.wikipedia.org/wiki/Locality-sensitive_hashing
+"""
+import random
+import re
+from array import array
+from collections import defaultdict
+from zlib import crc32
+
+
+__all__ = ('MinHashIndex', 'minhash', 'minhashes')
+
+
+NUM_PERM = 64  # Signature size
+BANDS = 16  # LSH bands; candidates are texts with similarity above ~(1 / BANDS) ** (1 / ROWS)
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3  # Words
+
+PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+_rnd = random.Random(0)  # Signatures are persisted, so permutations must be stable
+PERMUTATIONS = [(_rnd.randrange(1, PRIME), _rnd.randrange(0, PRIME)) for _ in range(NUM_PERM)]
+
+RE_TAG = re.compile(r'<[^>]+>')
+RE_WORD = re.compile(r'\w+')
+
+Signature = array
+
+
+def shingles(text: str) -> set[int]:
+    words = RE_WORD.findall(RE_TAG.sub(' ', text).lower())
+    n = max(len(words) - SHINGLE_SIZE + 1, 1)
+    return {crc32(' '.join(words[i:i + SHINGLE_SIZE]).encode()) for i in range(n)} if words else set()
+
+
+def minhash(text: str) -> Signature | None:
+    """
+    Calculate MinHash signature of text.
+
+    :param text: text (HTML tags are ignored).
+    :return: Signature or `None` if there are no words in the text.
+    """
+    hashes = shingles(text)
+    if not hashes:
+        return None
+
+    return array('I', (min(((a * h + b) % PRIME) & MAX_HASH for h in hashes) for a, b in PERMUTATIONS))
+
+
+def minhashes(texts: list[str]) -> list[bytes | None]:
+    """
+    Calculate MinHash signatures of texts in a picklable form (e.g. in a process pool).
+
+    :param texts: texts.
+    :return: Signatures bytes.
+    """
+    return [s.tobytes() if (s := minhash(text)) is not None else None for text in texts]
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """
+    Estimate Jaccard similarity of texts by their signatures.
+    """
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+class MinHashIndex:
+    """
+    LSH index of MinHash signatures.
+
+    Signatures are split into bands; texts with a matching band are candidates, and candidates with
+    estimated similarity below the threshold are dropped. Lookup time doesn't depend on the index size.
+    """
+
+    def __init__(self, threshold: float):
+        """
+        :param threshold: minimum Jaccard similarity of near-duplicates.
+        """
+        self.threshold = threshold
+        self._signatures: list[Signature] = []
+        self._buckets: list[dict[bytes, list[int]]] = [defaultdict(list) for _ in range(BANDS)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    @staticmethod
+    def _bands(signature: Signature):
+        return enumerate(signature[i:i + ROWS].tobytes() for i in range(0, NUM_PERM, ROWS))
+
+    def add(self, signature: Signature | bytes | memoryview):
+        signature = array('I', bytes(signature)) if not isinstance(signature, array) else signature
+
+        for band, key in self._bands(signature):
+            self._buckets[band][key].append(len(self._signatures))
+        self._signatures.append(signature)
+
+    def has_duplicate(self, signature: Signature | bytes | memoryview) -> bool:
+        """
+        Check if a near-duplicate of the text is in the index.
+
+        :param signature: text signature.
+        :return: `True` if there's a near-duplicate.
+        """
+        signature = array('I', bytes(signature)) if not isinstance(signature, array) else signature
+        candidates = set()
+        for band, key in self._bands(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        return any(similarity(signature, self._signatures[i]) >= self.threshold for i in candidates)
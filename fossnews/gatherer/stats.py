@@ -0,0 +1,89 @@
+"""Gathering statistics: per-stage durations and HTTP counters recorded in gathering results."""
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from types import SimpleNamespace
+
+from aiohttp import (
+    ClientSession, TraceConfig, TraceRequestEndParams, TraceRequestExceptionParams, TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+)
+
+from .metrics import INFLIGHT_REQUESTS
+from .models import GatheringResult
+
+
+__all__ = (
+    'count_retry',
+    'gathering_result',
+    'set_http_status',
+    'stage_timer',
+    'trace_config',
+)
+
+
+# Gathering result of the source being gathered (statistics are recorded in it)
+gathering_result: ContextVar[GatheringResult | None] = ContextVar('gathering_result', default=None)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """
+    Add duration of the gathering stage to the current gathering result (if any).
+
+    :param stage: stage name: `fetch`, `parse`, `enrich`, `dedup` or `insert`.
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        if (result := gathering_result.get()) is not None:
+            field = f'{stage}_time'
+            setattr(result, field, getattr(result, field) + perf_counter() - start)
+
+
+def count_retry():
+    """Count retried request in the current gathering result (if any)."""
+    if (result := gathering_result.get()) is not None:
+        result.retry_count += 1
+
+
+def set_http_status(status: int):
+    """Set source response HTTP status in the current gathering result (if any)."""
+    if (result := gathering_result.get()) is not None:
+        result.http_status = status
+
+
+async def on_request_start(session: ClientSession, context: SimpleNamespace, params: TraceRequestStartParams):
+    INFLIGHT_REQUESTS.inc()
+
+    # `RetryClient` passes the attempt number in the request trace context
+    if (context.trace_request_ctx or {}).get('current_attempt', 1) > 1:
+        count_retry()
+
+
+async def on_request_finish(session: ClientSession, context: SimpleNamespace,
+                            params: TraceRequestEndParams | TraceRequestExceptionParams):
+    INFLIGHT_REQUESTS.dec()
+
+
+async def on_response_chunk_received(session: ClientSession, context: SimpleNamespace,
+                                     params: TraceResponseChunkReceivedParams):
+    if (result := gathering_result.get()) is not None:
+        result.response_bytes += len(params.chunk)
+
+
+def trace_config() -> TraceConfig:
+    """
+    Create `aiohttp` client tracing configuration recording requests statistics in the current gathering result
+    and requests in progress metric.
+
+    :return: Tracing configuration.
+    """
+    config = TraceConfig()
+    config.on_request_start.append(on_request_start)
+    config.on_request_end.append(on_request_finish)
+    config.on_request_exception.append(on_request_finish)
+    config.on_response_chunk_received.append(on_response_chunk_received)
+    return config
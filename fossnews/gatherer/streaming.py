@@ -0,0 +1,199 @@
+"""Streaming news export."""
+import csv
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections.abc import AsyncIterator, Iterator
+from datetime import date, datetime, time
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from .models import DigestIssue, News
+
+
+__all__ = (
+    'EXPORT_FORMATS',
+    'NEWS_FIELDS',
+    'aexport_news',
+    'decode_cursor',
+    'encode_cursor',
+    'export_news',
+    'issue_news',
+    'news_changes',
+    'period_news',
+)
+
+
+# Exported news fields
+NEWS_FIELDS = (
+    'id', 'title', 'author', 'url', 'origin', 'summary', 'content', 'content_type', 'language',
+    'published_at', 'gathered_at', 'updated_at', 'gathering_id',
+)
+
+# News changes cursor: transaction ID all changes made by earlier transactions are exported before
+Cursor = int
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    return urlsafe_b64encode(str(cursor).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode news changes cursor.
+
+    :param cursor: encoded cursor.
+    :return: Transaction ID changes are exported since.
+    :raise ValueError: if cursor is invalid.
+    """
+    try:
+        return int(urlsafe_b64decode(cursor.encode()).decode())
+    except (BinasciiError, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f'Invalid cursor: {cursor}') from e
+
+
+@sync_to_async
+def changes_horizon() -> Cursor:
+    """
+    Get the oldest transaction still in progress: all transactions before it are either committed or aborted.
+
+    :return: Transaction ID (the next one if there are no transactions in progress).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint')
+        return cursor.fetchone()[0]
+
+
+def ndjson(row: dict) -> bytes:
+    return json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False).encode() + b'\n'
+
+
+async def news_changes(since: Cursor | None, chunk_size: int = 1000) -> AsyncIterator[bytes]:
+    """
+    Stream news added or updated after the cursor as `NDJSON`_.
+
+    The last line is the cursor to get the next changes: ``{"cursor": "..."}``.
+    Rows are fetched from a server-side cursor in chunks, so memory usage doesn't depend on the number of changes.
+
+    News are tracked by the ID of the transaction that changed them last (:attr:`News.change_xid` is set by DB
+    trigger). Changes are exported up to the oldest transaction in progress, so changes committed later
+    (however long transactions take) are exported next time, and server clocks don't matter.
+
+    .. _NDJSON: https://github.com/ndjson/ndjson-spec
+
+    :param since: cursor returned with the previous changes (all news if not set).
+    :param chunk_size: the number of rows fetched at once.
+    :return: Async iterator of NDJSON lines.
+    """
+    until = await changes_horizon()
+    news: QuerySet = News.objects.filter(change_xid__lt=until)
+    if since is not None:
+        news = news.filter(change_xid__gte=since)
+
+    async for row in news.order_by('change_xid', 'id').values(*NEWS_FIELDS).aiterator(chunk_size=chunk_size):
+        yield ndjson(row)
+
+    yield ndjson(dict(cursor=encode_cursor(until)))
+
+
+class Echo:
+    """File-like object that returns written value (to get CSV lines from `csv.writer`)."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class CsvFormat:
+    content_type = 'text/csv'
+    extension = 'csv'
+
+    def __init__(self):
+        self.writer = csv.writer(Echo())
+
+    def header(self) -> bytes:
+        return self.writer.writerow(NEWS_FIELDS).encode()
+
+    def row(self, row: tuple) -> bytes:
+        return self.writer.writerow(row).encode()
+
+
+class NdjsonFormat:
+    content_type = 'application/x-ndjson'
+    extension = 'ndjson'
+
+    def header(self) -> bytes:
+        return b''
+
+    def row(self, row: tuple) -> bytes:
+        return ndjson(dict(zip(NEWS_FIELDS, row)))
+
+
+EXPORT_FORMATS = {
+    'csv': CsvFormat,
+    'ndjson': NdjsonFormat,
+}
+
+
+def start_of_day(day: date) -> datetime:
+    """Get the start of the day in the current time zone (filtering by it, unlike `__date`, can use an index)."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def period_news(since: date | None = None, until: date | None = None) -> QuerySet:
+    """
+    Get news gathered during the period.
+
+    :param since: period start date (inclusive).
+    :param until: period end date (exclusive).
+    :return: News.
+    """
+    news = News.objects.all()
+    if since is not None:
+        news = news.filter(gathered_at__gte=start_of_day(since))
+    if until is not None:
+        news = news.filter(gathered_at__lt=start_of_day(until))
+    return news
+
+
+def issue_news(issue: DigestIssue) -> QuerySet:
+    """
+    Get news gathered for the digest issue: since the previous issue until this one.
+
+    Issue date is its publication date or the planned one if it's not published yet.
+
+    :param issue: digest issue.
+    :return: News.
+    """
+    previous = DigestIssue.objects.filter(number__lt=issue.number).order_by('-number').first()
+    since = (previous.published_at or previous.planned_at) if previous else None
+    return period_news(since, issue.published_at or issue.planned_at)
+
+
+def export_news(news: QuerySet, fmt: str, chunk_size: int = 2000) -> Iterator[bytes]:
+    """
+    Export news in CSV or NDJSON format.
+
+    Rows are fetched as tuples from a server-side cursor in chunks, without model instances,
+    so memory usage doesn't depend on the number of news.
+
+    :param news: news to export.
+    :param fmt: format: see :data:`EXPORT_FORMATS`.
+    :param chunk_size: the number of rows fetched at once.
+    :return: Iterator of lines.
+    """
+    fmt = EXPORT_FORMATS[fmt]()
+    yield fmt.header()
+    for row in news.order_by('gathered_at', 'id').values_list(*NEWS_FIELDS).iterator(chunk_size=chunk_size):
+        yield fmt.row(row)
+
+
+async def aexport_news(news: QuerySet, fmt: str, chunk_size: int = 2000) -> AsyncIterator[bytes]:
+    """Export news in CSV or NDJSON format asynchronously (see :func:`export_news`)."""
+    fmt = EXPORT_FORMATS[fmt]()
+    yield fmt.header()
+    async for row in news.order_by('gathered_at', 'id').values_list(*NEWS_FIELDS).aiterator(chunk_size=chunk_size):
+        yield fmt.row(row)
@@ -1,62 +1,44 @@
-import asyncio
 import logging
-from datetime import datetime
-from traceback import format_exception
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
 
-import spacy
 from aiohttp import ClientTimeout, TCPConnector
 from aiohttp_retry import RetryClient, FibonacciRetry
-from asgiref.sync import async_to_sync, sync_to_async
-from celery import shared_task
+from asgiref.sync import async_to_sync
+from billiard.process import current_process as current_pool_process
+from celery import chord, group, shared_task
 from dynamic_preferences.registries import global_preferences_registry
 
-from .models import GatheringResult, News, Source
-from .parsers import Client, SourceParsers
+from .models import Source
+from .parsers import feed_iterparse, news_parsers_limit, parser_executor
+from .pipeline import GatheringPipeline, classify_duplicates
+from .stats import trace_config
+from .throttling import RETRY_STATUSES, ThrottledClient
 
 
 log = logging.getLogger('fossnews.gatherer')
 preferences = global_preferences_registry.manager()
-source_parsers = SourceParsers()
-# nlp = dict(
-#     en=spacy.load('en_core_web_trf'),
-#     ru=spacy.load('ru_core_news_lg'),
-# )
 
 
-async def filter_news(news: News) -> bool:
-    return not any([
-        await News.objects.filter(url=news.url).aexists(),  # Filter duplicates
-        # TODO: add filters
-    ])
-
-
-async def gather_from_source(client: Client, source: Source) -> GatheringResult:
-    log.info('Started news gathering from %s', source.title)
-
-    result = GatheringResult(source=source, started_at=datetime.utcnow())
-    await sync_to_async(result.save)()
-
-    try:
-        news = await source_parsers.parse(client, source)
-        result.total_count = len(news)
-        errors = [''.join(format_exception(e)) for e in news if isinstance(e, BaseException)]
-        result.errors_count = len(errors)
-        result.errors = '\n'.join(errors)
-        news = [n for n in news if isinstance(n, News) and await filter_news(n)]
-        result.filtered_count = result.total_count - result.errors_count - len(news)
-        for n in news:
-            n.gathering = result
-        result.saved_count = len(await News.objects.abulk_create(news))
-    except Exception as e:  # Report all exceptions (if any) in the task result
-        result.errors_count += 1
-        result.errors = ''.join(format_exception(e))
+def create_executor(mode: str, workers: int) -> Executor | None:
+    """
+    Create executor for CPU-bound parsing.
 
-    result.finished_at = datetime.utcnow()
-    await sync_to_async(result.save)()
+    :param mode: executor mode: `loop`, `thread` or `process`.
+    :param workers: the number of executor workers (0 means the number of CPUs).
+    :return: Executor or `None` to parse in the event loop.
+    """
+    executors = dict(thread=ThreadPoolExecutor, process=ProcessPoolExecutor)
+    if mode not in executors:
+        return None
 
-    log.info('Finished news gathering from %s', source.title)
+    # Celery prefork pool workers are daemonic
+    if mode == 'process' and (multiprocessing.current_process().daemon or current_pool_process().daemon):
+        log.warning('Daemonic processes are not allowed to have children, parsing feeds in a thread pool')
+        mode = 'thread'
 
-    return result
+    return executors[mode](max_workers=workers or None)
 
 
 async def agather(*args, **kwargs) -> list[dict]:
@@ -67,21 +49,93 @@ async def agather(*args, **kwargs) -> list[dict]:
     :param kwargs: Source filter kwargs.
     :return: List of gathering results by source.
     """
+    prefs = await preferences.asection('gatherer')
     client_args = dict(
-        connector=TCPConnector(limit=await preferences.aget('gatherer.connection_limit')),
-        timeout=ClientTimeout(total=await preferences.aget('gatherer.connection_timeout')),
-        retry_options=FibonacciRetry(attempts=await preferences.aget('gatherer.connection_retries')),
+        connector=TCPConnector(limit=prefs['connection_limit']),
+        timeout=ClientTimeout(total=prefs['connection_timeout']),
+        retry_options=FibonacciRetry(
+            attempts=prefs['connection_retries'],
+            statuses=RETRY_STATUSES,
+            retry_all_server_errors=False,
+        ),
         raise_for_status=True,
+        trace_configs=[trace_config()],
         headers={
-            'User-Agent': await preferences.aget('gatherer.user_agent'),
+            'User-Agent': prefs['user_agent'],
         },
     )
 
-    async with RetryClient(**client_args) as client:
-        tasks = [gather_from_source(client, source) async for source in Source.objects.filter(*args, **kwargs)]
-        return [r.to_dict() for r in await asyncio.gather(*tasks)]
+    executor = create_executor(prefs['parser_executor'], prefs['parser_workers'])
+    executor_token = parser_executor.set(executor)
+    limit_token = news_parsers_limit.set(prefs['news_parsers_limit'])
+    iterparse_token = feed_iterparse.set(prefs['feed_iterparse'])
+
+    try:
+        async with RetryClient(**client_args) as client:
+            client = ThrottledClient(
+                client,
+                limit=prefs['host_connection_limit'],
+                delay=prefs['host_request_delay'],
+                retries=prefs['connection_retries'],
+                max_retry_after=prefs['max_retry_after'],
+            )
+            pipeline = GatheringPipeline(
+                client,
+                workers=prefs['source_workers'],
+                queue_size=prefs['queue_size'],
+                batch_size=prefs['batch_size'],
+                duplicate_threshold=prefs['duplicate_threshold'],
+                duplicate_window=prefs['duplicate_window'],
+            )
+            results = await pipeline.run(Source.objects.filter(*args, **kwargs).aiterator())
+            return [r.to_dict() for r in results]
+    finally:
+        parser_executor.reset(executor_token)
+        news_parsers_limit.reset(limit_token)
+        feed_iterparse.reset(iterparse_token)
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
 
 @shared_task(name='gather')
 def gather(*args, **kwargs):
-    return async_to_sync(agather)(*args, **kwargs)
+    """
+    Gather news from selected sources.
+
+    If ``gatherer.shard_size`` preference is set, sources are split into shards gathered by separate
+    :func:`gather_shard` tasks in parallel, and their results are aggregated by :func:`gather_results` task
+    (including near-duplicates search among news of different shards).
+
+    :param args: Source filter args.
+    :param kwargs: Source filter kwargs.
+    :return: List of gathering results by source, or shards chord ID.
+    """
+    shard_size = preferences['gatherer.shard_size']
+    if not shard_size:
+        return async_to_sync(agather)(*args, **kwargs)
+
+    pks = list(Source.objects.filter(*args, **kwargs).order_by('pk').values_list('pk', flat=True))
+    shards = group(gather_shard.s(pks[i:i + shard_size]) for i in range(0, len(pks), shard_size))
+    log.info('Gathering news from %d sources in %d shards', len(pks), len(shards))
+
+    return chord(shards)(gather_results.s()).id
+
+
+@shared_task(name='gather_shard')
+def gather_shard(pks: list[int]):
+    return async_to_sync(agather)(pk__in=pks)
+
+
+@shared_task(name='gather_results')
+def gather_results(results: list[list[dict]]):
+    results = list(chain.from_iterable(results))
+
+    # Shards don't see each other's news
+    count = classify_duplicates(
+        [r['id'] for r in results if r['id'] is not None],
+        threshold=preferences['gatherer.duplicate_threshold'],
+        window=preferences['gatherer.duplicate_window'],
+    )
+    log.info('Found %d near-duplicates among news of %d sources', count, len(results))
+
+    return results
@@ -1,3 +1,321 @@
-from django.test import TestCase
+import asyncio
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ..classifier.models import Classification, NewsStatus
+from .admin import GatheringResultAdmin
+from .cache import bump_version
+from .models import *
+from .parsers import SEEN_GUIDS_LIMIT, UrlPatternIndex, advance_watermark, feed_language, parse_feed_entries, urlhash
+from .pipeline import GatheringPipeline, classify_duplicates
+from .similarity import minhashes
+from .streaming import decode_cursor, news_changes
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class QueriesCountTestCase(TestCase):
+    """Listing more rows must not cost more queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        cls.now = datetime.now(timezone.utc)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def create_news(self, count: int) -> GatheringResult:
+        n = Source.objects.count()
+        source = Source.objects.create(title=f'Source {n}', url=f'https://example{n}.com/rss')
+        result = GatheringResult.objects.create(source=source, started_at=self.now, finished_at=self.now)
+        News.objects.bulk_create([News(
+            title=f'News {n}.{i}',
+            url=f'https://example{n}.com/news/{i}',
+            url_hash=urlhash(f'https://example{n}.com/news/{i}'),
+            published_at=self.now,
+            gathered_at=self.now,
+            gathering=result,
+        ) for i in range(count)])
+        return result
+
+    def count_queries(self, url: str) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assertQueriesCountIsConstant(self, url: str):
+        self.create_news(1)
+        expected = self.count_queries(url)
+        for _ in range(10):
+            self.create_news(2)
+        self.assertEqual(self.count_queries(url), expected)
+
+    def test_admin_news_list(self):
+        self.assertQueriesCountIsConstant(reverse('admin:gatherer_news_changelist'))
+
+    def test_admin_gathering_results_list(self):
+        self.assertQueriesCountIsConstant(reverse('admin:gatherer_gatheringresult_changelist'))
+
+    def test_api_news_list(self):
+        self.assertQueriesCountIsConstant(reverse('gatherer:news-list'))
+
+    def test_api_gathering_results_list(self):
+        self.assertQueriesCountIsConstant(reverse('gatherer:gatheringresult-list'))
+
+    def test_admin_gathering_result_news_is_truncated(self):
+        result = self.create_news(GatheringResultAdmin.news_limit + 5)
+        response = self.client.get(reverse('admin:gatherer_gatheringresult_change', args=[result.pk]))
+
+        self.assertContains(response, '... and 5 more')
+        self.assertNotContains(response, f'News 0.{GatheringResultAdmin.news_limit} ')
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CachedResponseTestCase(TestCase):
+    def setUp(self):
+        now = datetime.now(timezone.utc)
+        source = Source.objects.create(title='Source', url='https://example.com/rss')
+        GatheringResult.objects.create(source=source, started_at=now, finished_at=now)
+        self.url = reverse('gatherer:gatheringresult-list')
+
+    def test_repeat_read_is_cached(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 0)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_version_bump_invalidates_cache(self):
+        etag = self.client.get(self.url)['ETag']
+        bump_version()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertGreater(len(queries), 0)
+
+
+class UrlPatternIndexTestCase(SimpleTestCase):
+    """Index lookup must match the linear search of the first matching pattern."""
+
+    patterns = [re.compile(p) for p in (
+        r'(?i)^https://www\.Example\.com/news/',
+        r'^https://www\.example\.com/',
+        r'(?i)^https?://[^/]+/generic/',
+        r'^https://(www\.)?other\.org/(\d+)$',
+        r'^https?://other\.org/x/',
+        r'^https://third\.net$',
+        r'^https://alt-a\.com/|^https://alt-b\.com/',
+        r'(?x) ^https://verbose\.com/ \d+ $',
+    )]
+    urls = (
+        'https://www.example.com/NEWS/1',
+        'https://www.example.com/news/1',
+        'https://www.example.com/other',
+        'http://www.example.com/other',
+        'https://any.com/GENERIC/1',
+        'https://other.org/12',
+        'https://www.other.org/12',
+        'https://other.org/12/',
+        'http://other.org/x/1',
+        'https://third.net',
+        'https://third.net/1',
+        'https://alt-a.com/1',
+        'https://alt-b.com/1',
+        'https://verbose.com/1',
+        'https://unknown.net/',
+    )
+
+    def setUp(self):
+        self.index = UrlPatternIndex()
+        for i, pattern in enumerate(self.patterns):
+            self.index.add(pattern, i)
+
+    def test_find_matches_linear_search(self):
+        for url in self.urls:
+            with self.subTest(url=url):
+                expected = next((i for i, p in enumerate(self.patterns) if p.match(url)), None)
+                self.assertEqual(self.index.find(url), expected)
+
+    def test_unsupported_patterns_are_rejected(self):
+        for pattern in (
+            r'^https://a\.com/(?P<id>\d+)',
+            r'^https://a\.com/(\d)/\1',
+            r'^https://a\.com/(?P<id>\d)(?P=id)',
+            r'(?x)^https://a\.com/  # Comment swallowing the combined regex',
+        ):
+            with self.subTest(pattern=pattern), self.assertRaises(ValueError):
+                self.index.add(re.compile(pattern), None)
+
+
+class FeedParsingTestCase(SimpleTestCase):
+    """Streaming and `feedparser` feed parsing must give the same results."""
+
+    feeds = {
+        'rss': (Language.EN, b"""<?xml version="1.0" encoding="utf-8"?>
+            <rss version="2.0"><channel><title>Feed</title><link>https://example.com/</link><language>en-us</language>
+            <item><guid>https://example.com/1</guid><link>https://example.com/1</link><title>News</title>
+            <description>Summary</description><pubDate>Mon, 01 Jan 2024 12:00:00 +0300</pubDate></item>
+            </channel></rss>"""),
+        'atom': (Language.RU, b"""<?xml version="1.0" encoding="utf-8"?>
+            <feed xmlns="http://www.w3.org/2005/Atom" xml:lang="ru-RU"><title>Feed</title><id>https://example.com/</id>
+            <updated>2024-01-01T09:00:00Z</updated><entry><id>https://example.com/1</id>
+            <link href="https://example.com/1"/><title>News</title><summary>Summary</summary>
+            <updated>2024-01-01T09:00:00Z</updated></entry></feed>"""),
+    }
+
+    def test_parsers_agree(self):
+        for name, (language, body) in self.feeds.items():
+            for iterparse in (False, True):
+                with self.subTest(feed=name, iterparse=iterparse):
+                    tag, entries = parse_feed_entries(body, None, None, [], iterparse)
+                    other = next(lang for lang in Language if lang != language)  # Not to pass by default
+                    self.assertEqual(feed_language(tag, other), language)
+                    self.assertEqual([e.published_at for e in entries], [datetime(2024, 1, 1, 9, tzinfo=timezone.utc)])
+
+    def test_old_and_seen_entries_are_skipped(self):
+        published_at = datetime(2024, 1, 1, 9, tzinfo=timezone.utc)
+        items = ''.join(
+            f'<item><guid>https://example.com/{i}</guid><link>https://example.com/{i}</link><title>News {i}</title>'
+            f'<description>Summary</description><pubDate>{format_datetime(published_at - timedelta(hours=i))}</pubDate>'
+            f'</item>'
+            for i in range(3)
+        )
+        body = f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>'.encode()
+
+        for iterparse in (False, True):
+            with self.subTest(iterparse=iterparse):
+                _, entries = parse_feed_entries(body, None, published_at - timedelta(hours=1),
+                                                ['https://example.com/1'], iterparse)
+                self.assertEqual([e.guid for e in entries], ['https://example.com/0'])
+
+    def test_feed_language(self):
+        for tag, language in (('en', Language.EN), ('en-US', Language.EN), ('ru_RU', Language.RU), ('RU', Language.RU),
+                              ('de-DE', Language.RU), ('', Language.RU), (None, Language.RU)):
+            with self.subTest(tag=tag):
+                self.assertEqual(feed_language(tag, Language.RU), language)
+
+
+    def test_duplicates_of_concurrent_gatherings_are_classified(self):
+        now = datetime.now(timezone.utc)
+        text = 'Linux kernel 6.8 is released with new drivers and scheduler improvements'
+        results = [GatheringResult.objects.create(source=source, started_at=now) for source in self.sources[:2]]
+        News.objects.bulk_create([News(
+            title=text,
+            url=f'https://example{i}.com/1',
+            published_at=now,
+            gathered_at=now,
+            gathering=result,
+            minhash=minhashes([text])[0],
+        ) for i, result in enumerate(results)])
+
+        self.assertEqual(classify_duplicates([r.pk for r in results], threshold=.8, window=1), 1)
+        self.assertEqual(list(Classification.objects.values_list('news__url', 'status')),
+                         [('https://example1.com/1', NewsStatus.DUPLICATE)])
+
+
+class NewsChangesTestCase(TransactionTestCase):
+    """Changes must be exported once committed (news are changed in transactions of their own here)."""
+
+    def changes(self, since: int | None) -> tuple[list[int], int]:
+        async def read():
+            return [json.loads(line) async for line in news_changes(since)]
+
+        *rows, last = async_to_sync(read)()
+        return [row['id'] for row in rows], last['cursor']
+
+    def test_changes_are_exported_once(self):
+        now = datetime.now(timezone.utc)
+        news = News.objects.create(title='News', url='https://example.com/1', published_at=now, gathered_at=now)
+
+        pks, cursor = self.changes(None)
+        self.assertEqual(pks, [news.pk])
+        self.assertEqual(self.changes(decode_cursor(cursor))[0], [])
+
+        News.objects.filter(pk=news.pk).update(title='Updated news')  # No `auto_now` update: it's up to DB
+        self.assertEqual(self.changes(decode_cursor(cursor))[0], [news.pk])
+
+
+
+class WatermarkTestCase(SimpleTestCase):
+    def setUp(self):
+        self.now = datetime.now(timezone.utc)
+        self.source = Source(title='Source', url='https://example.com/rss')
+
+    def test_watermark_is_the_newest_entry_date(self):
+        advance_watermark(self.source, [('1', self.now - timedelta(hours=2)), ('2', self.now - timedelta(hours=1))])
+        self.assertEqual(self.source.watermark_at, self.now - timedelta(hours=1))
+        self.assertEqual(self.source.seen_guids, ['2', '1'])
+
+        advance_watermark(self.source, [('0', self.now - timedelta(hours=3))])  # Late entry doesn't move it back
+        self.assertEqual(self.source.watermark_at, self.now - timedelta(hours=1))
+        self.assertEqual(self.source.seen_guids, ['0', '2', '1'])
+
+    def test_watermark_is_not_in_future(self):
+        advance_watermark(self.source, [('1', self.now + timedelta(days=365))])
+        self.assertLessEqual(self.source.watermark_at, datetime.now(timezone.utc))
+        self.assertEqual(self.source.seen_guids, ['1'])  # The entry is skipped as seen until its date
+
+    def test_seen_guids_are_limited(self):
+        advance_watermark(self.source, [(str(i), self.now) for i in range(SEEN_GUIDS_LIMIT + 10)])
+        self.assertEqual(len(self.source.seen_guids), SEEN_GUIDS_LIMIT)
+
+
+async def aiterate(items: list):
+    for item in items:
+        yield item
+
+
+class GatheringPipelineTestCase(TestCase):
+    def setUp(self):
+        self.sources = [Source.objects.create(title=f'Source {i}', url=f'https://example{i}.com/rss') for i in range(10)]
+        self.pipeline = GatheringPipeline(None, workers=2, queue_size=2, batch_size=10,
+                                          duplicate_threshold=.8, duplicate_window=1)
+
+    def run_pipeline(self) -> list[GatheringResult]:
+        # Pipeline must fail instead of hanging on queues if its tasks fail
+        return async_to_sync(asyncio.wait_for)(self.pipeline.run(aiterate(self.sources)), 5)
+
+    def test_worker_failure_is_raised(self):
+        with mock.patch.object(GatheringPipeline, 'gather_from_source', side_effect=RuntimeError('Worker failed')):
+            with self.assertRaisesMessage(RuntimeError, 'Worker failed'):
+                self.run_pipeline()
+
+    def test_result_save_failure_is_raised(self):
+        with mock.patch.object(GatheringResult, 'save', side_effect=DatabaseError('DB is down')):
+            with self.assertRaisesMessage(DatabaseError, 'DB is down'):
+                self.run_pipeline()
+
+    def test_bad_news_fail_only_their_source(self):
+        now = datetime.now(timezone.utc)
+        results = [GatheringResult.objects.create(source=source, started_at=now) for source in self.sources[:2]]
+        news = [News(
+            title=f'News {i}',
+            url=f'https://example{i}.com/{"news/" * 50 * i}',
+            published_at=now,
+            gathered_at=now,
+            gathering=result,
+        ) for i, result in enumerate(results)]
+        for n in news:
+            n.url_hash = urlhash(n.url)
+
+        async_to_sync(self.pipeline.flush)(news, results)
+
+        self.assertEqual([r.saved_count for r in results], [1, 0])
+        self.assertEqual([r.errors_count for r in results], [0, 1])
@@ -0,0 +1,149 @@
+"""Per-host requests throttling."""
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from aiohttp import ClientResponse, ClientResponseError, ClientSession
+from aiohttp_retry import RetryClient
+
+from .stats import count_retry
+
+
+__all__ = (
+    'RETRY_STATUSES',
+    'ThrottledClient',
+)
+
+
+log = logging.getLogger('fossnews.gatherer')
+
+# Response statuses to retry after a delay
+THROTTLING_STATUSES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+# Response statuses to retry immediately by `RetryClient`: throttled requests are retried only by `ThrottledClient`
+# (otherwise each throttled retry runs the whole `RetryClient` retries loop ignoring `Retry-After`)
+RETRY_STATUSES = frozenset(range(500, 600)) - THROTTLING_STATUSES
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse `Retry-After`_ header value.
+
+    .. _Retry-After: https://www.rfc-editor.org/rfc/rfc9110#field.retry-after
+
+    :param value: header value: delay in seconds or HTTP date.
+    :return: Delay in seconds (if any).
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.)
+    except ValueError:
+        pass
+
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.)
+    except (TypeError, ValueError):
+        return None
+
+
+class Host:
+    """Host requests scheduler: limits concurrent requests and keeps a minimum delay between them."""
+
+    def __init__(self, limit: int, delay: float):
+        """
+        :param limit: the number of concurrent requests to the host.
+        :param delay: minimum delay between requests to the host (in seconds).
+        """
+        self.semaphore = asyncio.Semaphore(limit)
+        self.delay = delay
+        self.next_at = 0.
+
+    async def wait(self):
+        """Wait for the next request slot."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        at = max(now, self.next_at)
+        self.next_at = at + self.delay  # Reserve the slot before waiting
+        if at > now:
+            await asyncio.sleep(at - now)
+
+    def postpone(self, delay: float):
+        """
+        Postpone all requests to the host.
+
+        :param delay: delay in seconds.
+        """
+        self.next_at = max(self.next_at, asyncio.get_running_loop().time() + delay)
+
+
+class ThrottledClient:
+    """
+    `aiohttp` client wrapper that is polite to hosts.
+
+    Requests are limited per host: the number of concurrent requests, minimum delay between requests.
+    Throttled requests (``429 Too Many Requests``, ``503 Service Unavailable``) are retried
+    after the delay from ``Retry-After`` header; all requests to the host are postponed meanwhile.
+    """
+
+    def __init__(
+        self,
+        client: ClientSession | RetryClient,
+        limit: int,
+        delay: float,
+        retries: int,
+        max_retry_after: float,
+    ):
+        """
+        :param client: `aiohttp` client session.
+        :param limit: the number of concurrent requests per host.
+        :param delay: minimum delay between requests to the same host (in seconds).
+        :param retries: the number of retries of throttled requests.
+        :param max_retry_after: maximum delay of throttled request retry (in seconds).
+        """
+        self.client = client
+        self.limit = limit
+        self.delay = delay
+        self.retries = retries
+        self.max_retry_after = max_retry_after
+        self.hosts: dict[str, Host] = {}
+
+    def host(self, url: str) -> Host:
+        name = urlsplit(url).hostname or ''
+        if name not in self.hosts:
+            self.hosts[name] = Host(self.limit, self.delay)
+        return self.hosts[name]
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs) -> AsyncIterator[ClientResponse]:
+        host = self.host(url)
+
+        async with host.semaphore:
+            for attempt in range(self.retries + 1):
+                await host.wait()
+                try:
+                    response = await self.client.request(method, url, **kwargs).__aenter__()
+                except ClientResponseError as e:
+                    if e.status not in THROTTLING_STATUSES or attempt == self.retries:
+                        raise
+
+                    retry_after = parse_retry_after(e.headers and e.headers.get('Retry-After'))
+                    delay = min(retry_after if retry_after is not None else 2 ** attempt, self.max_retry_after)
+                    log.warning('Request to %s is throttled (%s), retrying in %.1f s', url, e.status, delay)
+                    host.postpone(delay)
+                    count_retry()
+                    continue
+
+                try:
+                    yield response
+                finally:
+                    response.release()
+                return
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
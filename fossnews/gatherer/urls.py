@@ -1,5 +1,7 @@
+from django.urls import path
 from rest_framework import routers
 
+from .async_views import *
 from .views import *
 
 
@@ -11,4 +13,11 @@
 router.register(r'issue-links', DigestIssueLinkViewSet)
 
 app_name = 'gatherer'
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    path('async/sources/', AsyncSourceView.as_view(), name='async-source-list'),
+    path('async/sources/<int:pk>/', AsyncSourceView.as_view(), name='async-source-detail'),
+    path('async/results/', AsyncGatheringResultView.as_view(), name='async-gatheringresult-list'),
+    path('async/results/<int:pk>/', AsyncGatheringResultView.as_view(), name='async-gatheringresult-detail'),
+    path('async/news/', AsyncNewsView.as_view(), name='async-news-list'),
+    path('async/news/<int:pk>/', AsyncNewsView.as_view(), name='async-news-detail'),
+]
@@ -1,8 +1,22 @@
+from datetime import date
+from functools import reduce
+from operator import or_
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from .cache import CachedResponseMixin
 from .models import *
+from .models import SEARCH_CONFIGS, news_search_vector, search_config
+from .pagination import *
 from .serializers import *
+from .streaming import EXPORT_FORMATS, aexport_news, decode_cursor, issue_news, news_changes, period_news
 
 
 __all__ = (
@@ -20,16 +34,97 @@ class SourceViewSet(ModelViewSet):
     serializer_class = SourceSerializer
 
 
-class GatheringResultViewSet(ModelViewSet):
+class GatheringResultViewSet(CachedResponseMixin, ModelViewSet):
     permission_classes = []
-    queryset = GatheringResult.objects.all().order_by('-finished_at', 'source__title')
+    queryset = GatheringResult.objects.select_related('source').order_by('-finished_at', 'source__title')
     serializer_class = GatheringResultSerializer
+    pagination_class = GatheringResultPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':  # Cursor can't point to unfinished gathering
+            queryset = queryset.filter(finished_at__isnull=False)
+        return queryset
 
 
-class NewsViewSet(ModelViewSet):
+class NewsViewSet(CachedResponseMixin, ModelViewSet):
     permission_classes = [IsAdminUser]
     queryset = News.objects.all().order_by('title')
     serializer_class = NewsSerializer
+    pagination_class = NewsPagination
+
+    @action(detail=False, serializer_class=NewsSearchSerializer, pagination_class=PageNumberPagination)
+    def search(self, request):
+        """
+        Full text search of news by title, summary and content.
+
+        Query (`q` parameter) uses `web search syntax`_ and is matched in all news languages.
+        Results are ranked (title matches first) and have highlighted summary snippets (`headline`).
+
+        .. _web search syntax: https://www.postgresql.org/docs/current/textsearch-controls.html
+        """
+        q = request.query_params.get('q', '').strip()
+        if not q:
+            raise ValidationError({'q': 'This query parameter is required.'})
+
+        query = reduce(or_, (SearchQuery(q, config=config, search_type='websearch') for config in SEARCH_CONFIGS.values()))
+
+        vector = news_search_vector()
+        news = News.objects.annotate(search=vector).filter(search=query).annotate(
+            rank=SearchRank(vector, query),
+            headline=SearchHeadline('summary', query, config=search_config(), max_fragments=2),
+        ).order_by('-rank', '-gathered_at')
+
+        page = self.paginate_queryset(news)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+        return Response(self.get_serializer(news, many=True).data)
+
+    @action(detail=False)
+    def changes(self, request):
+        """
+        Stream news added or updated since the cursor (`since` parameter) as NDJSON.
+
+        The last line is the cursor for the next request: ``{"cursor": "..."}``.
+        """
+        since = request.query_params.get('since')
+        try:
+            since = decode_cursor(since) if since else None
+        except ValueError as e:
+            raise ValidationError({'since': str(e)})
+
+        return StreamingHttpResponse(news_changes(since), content_type='application/x-ndjson')
+
+    @action(detail=False)
+    def export(self, request):
+        """
+        Export news gathered for the digest issue (`issue` parameter: number)
+        or during the period (`since` and `until` parameters: ISO dates) as CSV or NDJSON (`type` parameter).
+        """
+        params = request.query_params
+        fmt = params.get('type', 'csv')
+        if fmt not in EXPORT_FORMATS:
+            raise ValidationError({'type': f'Must be one of: {", ".join(EXPORT_FORMATS)}.'})
+
+        if issue := params.get('issue'):
+            try:
+                issue = DigestIssue.objects.get(number=int(issue))
+            except (ValueError, DigestIssue.DoesNotExist):
+                raise ValidationError({'issue': 'Digest issue does not exist.'})
+            news, name = issue_news(issue), f'news-{issue.number}'
+        else:
+            period = {}
+            for param in ('since', 'until'):
+                try:
+                    period[param] = date.fromisoformat(params[param]) if params.get(param) else None
+                except ValueError as e:
+                    raise ValidationError({param: str(e)})
+            news, name = period_news(**period), 'news'
+
+        response = StreamingHttpResponse(aexport_news(news, fmt), content_type=EXPORT_FORMATS[fmt].content_type)
+        response['Content-Disposition'] = f'attachment; filename="{name}.{EXPORT_FORMATS[fmt].extension}"'
+        return response
 
 
 class DigestIssueViewSet(ModelViewSet):
@@ -40,5 +135,5 @@ class DigestIssueViewSet(ModelViewSet):
 
 class DigestIssueLinkViewSet(ModelViewSet):
     permission_classes = [IsAdminUser]
-    queryset = DigestIssueLink.objects.all().order_by('-issue__number', 'type')
+    queryset = DigestIssueLink.objects.select_related('issue').order_by('-issue__number', 'type')
     serializer_class = DigestIssueLinkSerializer
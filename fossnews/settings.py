@@ -48,10 +48,12 @@ def emails_list(value: str) -> list[tuple[str, str]]:
     DJANGO_DATABASE_NAME=str,
     DJANGO_DATABASE_USER=str,
     DJANGO_DATABASE_PASSWORD=str,
+    DJANGO_CACHE_URL=(str, 'filecache:///tmp/fossnews-cache'),
     DJANGO_FROM_EMAIL=str,
     DJANGO_SERVER_EMAIL=str,
     DJANGO_ADMINS=emails_list,
     DJANGO_MANAGERS=emails_list,
+    DJANGO_SPACY_PRELOAD=([str], []),
 )
 env.read_env('.env')
 env.prefix = 'DJANGO_'
@@ -68,6 +70,7 @@ def emails_list(value: str) -> list[tuple[str, str]]:
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.messages',
+    'django.contrib.postgres',
     'django.contrib.sessions',
     'django.contrib.staticfiles',
     'django_celery_beat',
@@ -77,7 +80,7 @@ def emails_list(value: str) -> list[tuple[str, str]]:
     'dynamic_preferences.users',
     'rest_framework',
     'fossnews.gatherer',
-    # 'fossnews.classifier',
+    'fossnews.classifier',
     # 'fossnews.telegram_bot',
 ]
 
@@ -146,6 +149,13 @@ def emails_list(value: str) -> list[tuple[str, str]]:
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+####  Cache  ###########################################################################################################
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# https://django-environ.readthedocs.io/en/latest/types.html#environ-env-cache-url
+CACHES = {
+    'default': env.cache(),
+}
+
 ####  Logging  #########################################################################################################
 # https://docs.djangoproject.com/en/4.1/topics/logging/
 # https://docs.python.org/3/library/logging.html
@@ -225,4 +235,16 @@ def emails_list(value: str) -> list[tuple[str, str]]:
             'type': 'rss',
         },
     },
+    'daily_news_classification': {
+        'schedule': crontab(hour=3, minute=1),
+        'task': 'classify',
+    },
+}
+
+####  spaCy  ###########################################################################################################
+# https://spacy.io/usage/models
+SPACY_MODELS = {
+    'en': 'en_core_web_trf',
+    'ru': 'ru_core_news_lg',
 }
+SPACY_PRELOAD = env('SPACY_PRELOAD')  # Languages of models to load at Celery worker start